@@ -0,0 +1 @@
+# Makes `src` importable when the tests are run with plain `pytest`
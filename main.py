@@ -14,11 +14,12 @@ def main():
     log("[INFO] Press '7' to start the bot.")
 
     while not bot.is_stopped():
-        if not hotkeys.paused:
+        # bot.update() paces itself at the current state's poll rate
+        if hotkeys.paused:
+            time.sleep(0.1)
+        else:
             bot.update()
 
-        time.sleep(0.1)
-
     log("[INFO] Bot finished.")
 
 
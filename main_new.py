@@ -5,8 +5,6 @@ from src.bot.bots.fishing import FishingBot
 from src.bot.bots.mining import MiningBot
 from src.bot.core.game.hotkeys import Hotkeys
 from src.bot.utils.logger import log
-from src.bot.config.fishing_config import FishingConfig
-from src.bot.config.mining_config import MiningConfig
 
 
 def show_bot_menu():
@@ -42,11 +40,8 @@ def show_bot_menu():
                 print(f"✅ Selected: {selected_bot_type}")
 
                 # Create proper config object based on bot type
-                if selected_bot_type == "fishing":
-                    bot_config = FishingConfig()
-                elif selected_bot_type == "mining":
-                    bot_config = MiningConfig()
-                else:
+                bot_config = BotFactory.create_default_config(selected_bot_type)
+                if bot_config is None:
                     print(f"[ERROR] Unknown bot type: {selected_bot_type}")
                     continue
 
@@ -91,9 +86,13 @@ def run_bot_with_menu(bot, hotkeys, bot_type):
     log(f"[INFO] Bot running. Press '7' to pause/resume, '0' to return to menu, '8' to exit, '9' for ROI visualizer.")
 
     iteration_count = 0
+    last_status = time.perf_counter()
     while not bot.is_stopped():
         if hotkeys is not None:
-            if not hotkeys.paused:
+            # bot.update() paces itself at the current state's poll rate
+            if hotkeys.paused:
+                time.sleep(0.1)
+            else:
                 bot.update()
             # Check if return to menu was requested
             if hasattr(hotkeys, 'return_to_menu') and hotkeys.return_to_menu:
@@ -104,10 +103,10 @@ def run_bot_with_menu(bot, hotkeys, bot_type):
             bot.update()
 
         iteration_count += 1
-        time.sleep(0.1)
 
-        # Show status every 1000 iterations (less spam)
-        if iteration_count % 1000 == 0:
+        # Show status once a minute; hot states run many cycles per second
+        if time.perf_counter() - last_status >= 60:
+            last_status = time.perf_counter()
             log(f"[INFO] Bot running... ({iteration_count} cycles)")
 
     return False
@@ -146,7 +145,9 @@ def main():
             # Return to bot selection menu
             log("[INFO] Returning to bot selection...")
             
-            # Clean up current bot and hotkeys
+            # Clean up current bot and hotkeys; stopping the bot also
+            # finishes its recording and releases held controls
+            bot.stop()
             if hotkeys is not None:
                 hotkeys.cleanup()
             bot = None
@@ -6,8 +6,6 @@ from ...framework.state_type import StateType
 from ...framework.registration import register_bot
 from ...config.fishing_config import FishingConfig
 from ...config.base_config import BaseConfig
-from ...core.game.controller import GameController
-from ...core.game.detector import Detector
 from ...shared.state_machine import StateMachine
 from ...shared.stats_tracker import StatsTracker
 from ...core.interceptors.level_check_interceptor import LevelCheckInterceptor
@@ -24,6 +22,7 @@ from .states import (
 @register_bot(
     "fishing",
     "Automated fishing bot that detects bites, plays minigames, and manages equipment",
+    config_class=FishingConfig,
 )
 class FishingBot(BaseBot):
     """Fishing bot implementation using the new framework"""
@@ -80,6 +79,10 @@ class FishingBot(BaseBot):
 
     def _init_components(self) -> None:
         """Initialize components after config is properly set"""
+        # Imported here: OpenCV and pyautogui are only needed once a bot runs
+        from ...core.game.controller import GameController
+        from ...core.game.detector import Detector
+
         # Core components with proper config
         self.detector = Detector(self.config)
         self.controller = GameController(self.config)
@@ -97,6 +100,10 @@ class FishingBot(BaseBot):
         if hasattr(self, '_temp_instance') and self._temp_instance:
             return
 
+        # Imported here: OpenCV and pyautogui are only needed once a bot runs
+        from ...core.game.controller import GameController
+        from ...core.game.detector import Detector
+
         # Initialize core components first
         self.detector = Detector(self.config)
         self.controller = GameController(self.config)
@@ -1,5 +1,5 @@
 import time
-from typing import Any
+from typing import Any, List
 from ....framework.base_state import BaseState
 from ....framework.state_type import StateType
 
@@ -12,17 +12,14 @@ class FishingCheckingRodState(BaseState):
         self.bot.log("[CHECKING_ROD] Checking rod...")
         time.sleep(1)
 
-        found_rod = False
-
-        # Check for different rod types
-        if self.detector.find(screen, "flex_rod", 5, debug=self.bot.config.debug_mode):
-            found_rod = True
-        elif self.detector.find(
-            screen, "sturdy_rod", 5, debug=self.bot.config.debug_mode
-        ):
-            found_rod = True
-        elif self.detector.find(screen, "reg_rod", 5, debug=self.bot.config.debug_mode):
-            found_rod = True
+        # Check for different rod types in parallel
+        found_rod = self.detector.find_many(
+            screen,
+            ["flex_rod", "sturdy_rod", "reg_rod"],
+            5,
+            first_match=True,
+            debug=self.bot.config.debug_mode,
+        ) is not None
 
         if not found_rod:
             self.bot.log("[CHECKING_ROD] ⚠️  Broken rod! Replacing...")
@@ -32,8 +29,7 @@ class FishingCheckingRodState(BaseState):
             self.controller.press_key("m")
             time.sleep(1)
 
-            x = 1650 + self.bot.config.screen.monitor_x
-            y = 580 + self.bot.config.screen.monitor_y
+            x, y = self.detector.click_point("new_rod")
 
             self.controller.move_to(x, y)
             time.sleep(0.5)
@@ -52,5 +48,8 @@ class FishingCheckingRodState(BaseState):
     def get_state_type(self) -> StateType:
         return StateType.CHECKING_ROD
 
+    def get_required_templates(self) -> List[str]:
+        return ["flex_rod", "sturdy_rod", "reg_rod"]
+
     def get_timeout_limit(self) -> float:
         return 15.0
@@ -1,5 +1,5 @@
 import time
-from typing import Any
+from typing import Any, List
 from ....framework.base_state import BaseState
 from ....framework.state_type import StateType
 
@@ -32,5 +32,8 @@ class FishingFinishingState(BaseState):
     def get_state_type(self) -> StateType:
         return StateType.FINISHING
 
+    def get_required_templates(self) -> List[str]:
+        return ["continue", "fishing_spot_btn"]
+
     def get_timeout_limit(self) -> float:
         return 10.0
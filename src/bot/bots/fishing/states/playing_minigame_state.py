@@ -1,5 +1,5 @@
 import time
-from typing import Any
+from typing import Any, List
 from ....framework.base_state import BaseState
 from ....framework.state_type import StateType
 
@@ -12,14 +12,13 @@ class FishingPlayingMinigameState(BaseState):
         self._current_direction = None
         self.switch_delay = 0.5
 
-    def _handle_arrow(self, direction: str, screen: Any) -> None:
+    def _handle_arrow(self, direction: str, found: bool) -> None:
         """Handle arrow detection and key presses"""
-        arrow_template = f"{direction}_arrow"
         key_to_press = "a" if direction == "left" else "d"
         key_to_release = "d" if direction == "left" else "a"
         opposite_direction = "right" if direction == "left" else "left"
 
-        if self.detector.find(screen, arrow_template):
+        if found:
             if self._current_direction is None:
                 self.bot.log(
                     f"[MINIGAME] ▶️ Moving to the {direction} (Holding '{key_to_press}')"
@@ -41,12 +40,14 @@ class FishingPlayingMinigameState(BaseState):
         fish_complete = 0
         failed = 0
 
-        if self.detector.find(screen, "success", 1, debug=False):
+        found = self.detector.find_many(screen, [("success", 1), ("failure", 1)])
+
+        if found["success"]:
             fish_complete = 1
             self.bot.log("[MINIGAME] 🐟 Fish caught!")
             self.bot.stats.increment("fish_caught")
 
-        if fish_complete == 0 and self.detector.find(screen, "failure", 1, debug=False):
+        if fish_complete == 0 and found["failure"]:
             fish_complete = 1
             failed = 1
             self.bot.log("[MINIGAME] 🐟 Fish got away!")
@@ -71,13 +72,20 @@ class FishingPlayingMinigameState(BaseState):
                     time.sleep(2)
                     return StateType.CHECKING_ROD
 
-        self._handle_arrow("left", screen)
-        self._handle_arrow("right", screen)
+        direction, _, _ = self.detector.find_direction(screen)
+        self._handle_arrow("left", direction == "left")
+        self._handle_arrow("right", direction == "right")
 
         return StateType.PLAYING_MINIGAME
 
     def get_state_type(self) -> StateType:
         return StateType.PLAYING_MINIGAME
 
+    def get_required_templates(self) -> List[str]:
+        return ["success", "failure", "left_arrow", "right_arrow"]
+
+    def get_poll_rate(self) -> float:
+        return 0  # arrow switches need the newest frame
+
     def get_timeout_limit(self) -> float:
         return 30.0
@@ -1,5 +1,5 @@
 import time
-from typing import Any
+from typing import Any, List
 from ....framework.base_state import BaseState
 from ....framework.state_type import StateType
 
@@ -18,8 +18,7 @@ class FishingStartingState(BaseState):
         if self.detector.find(
             screen, "connect_server", 5, debug=self.bot.config.debug_mode
         ):
-            x = 1100 + self.bot.config.screen.monitor_x
-            y = 795 + self.bot.config.screen.monitor_y
+            x, y = self.detector.click_point("connect_server")
 
             self.controller.move_to(x, y)
             time.sleep(0.5)
@@ -76,5 +75,11 @@ class FishingStartingState(BaseState):
     def get_state_type(self) -> StateType:
         return StateType.STARTING
 
+    def get_required_templates(self) -> List[str]:
+        return ["connect_server", "fishing_spot_btn", "level_check"]
+
+    def get_poll_rate(self) -> float:
+        return 4.0  # menus and loading screens change slowly
+
     def get_timeout_limit(self) -> float:
         return 10.0
@@ -1,5 +1,5 @@
 import time
-from typing import Any
+from typing import Any, List
 from ....framework.base_state import BaseState
 from ....framework.state_type import StateType
 
@@ -32,5 +32,11 @@ class FishingWaitingForBiteState(BaseState):
     def get_state_type(self) -> StateType:
         return StateType.WAITING_FOR_BITE
 
+    def get_required_templates(self) -> List[str]:
+        return ["exclamation"]
+
+    def get_poll_rate(self) -> float:
+        return 0  # every frame counts when the fish bites
+
     def get_timeout_limit(self) -> float:
         return 25.0
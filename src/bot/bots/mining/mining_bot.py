@@ -17,7 +17,9 @@ from .states import (
 
 
 @register_bot(
-    "mining", "Automated mining bot that scans for ore deposits and manages inventory"
+    "mining",
+    "Automated mining bot that scans for ore deposits and manages inventory",
+    config_class=MiningConfig,
 )
 class MiningBot(BaseBot):
     """Mining bot implementation using framework"""
@@ -11,6 +11,14 @@ class BaseConfig(ABC):
         self.target_fps = 0  # 0 means unlimited
         self.default_delay = 0.5
 
+        # Capture frames on a background thread (0 fps means unlimited)
+        self.threaded_capture = False
+        self.capture_fps = 0
+
+        # Directory to record captured frames into for offline replay
+        # (empty disables recording)
+        self.record_path = ""
+
         # Bot-specific configuration
         self._bot_specific = {}
 
@@ -50,6 +58,9 @@ class BaseConfig(ABC):
             "debug_mode": self.debug_mode,
             "target_fps": self.target_fps,
             "default_delay": self.default_delay,
+            "threaded_capture": self.threaded_capture,
+            "capture_fps": self.capture_fps,
+            "record_path": self.record_path,
             "state_timeouts": self.get_state_timeouts(),
             "bot_specific": self._bot_specific,
         }
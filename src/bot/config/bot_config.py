@@ -1,7 +1,4 @@
-try:
-    from .screen_config import ScreenConfig
-except ImportError:
-    from .screen_config_safe import ScreenConfig
+from .screen_config import ScreenConfig
 from .detection_config import DetectionConfig
 
 
@@ -0,0 +1,46 @@
+import json
+import time
+
+from .paths import CALIBRATION_PATH
+
+
+def _size_key(width, height):
+    return f"{width}x{height}"
+
+
+def load_calibration(width, height, path=CALIBRATION_PATH):
+    """
+    Calibrated ROIs for a window size as {template: (x, y, w, h)}, in
+    client coordinates. Empty when the size was never calibrated.
+    """
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        print(f"Warning: Could not read calibration from {path}: {e}")
+        return {}
+
+    entry = data.get(_size_key(width, height), {})
+    return {name: tuple(roi) for name, roi in entry.get("rois", {}).items()}
+
+
+def save_calibration(width, height, rois, frames=0, path=CALIBRATION_PATH):
+    """
+    Store calibrated ROIs for a window size. Templates calibrated before and
+    missing from rois are kept; other window sizes are left untouched.
+    """
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        data = {}
+
+    entry = data.setdefault(_size_key(width, height), {"rois": {}})
+    entry["rois"].update({name: list(roi) for name, roi in rois.items()})
+    entry["frames"] = entry.get("frames", 0) + frames
+    entry["updated"] = time.strftime("%Y-%m-%d %H:%M:%S")
+
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
@@ -5,8 +5,80 @@ class DetectionConfig:
 
         self.precision = 0.65
 
+        # How ROIs are searched when a state asks for a radius > 0:
+        # "single_pass" pads the ROI by the radius and runs one match,
+        # "concentric" re-matches the ROI at every offset (legacy, slow)
+        self.radius_search_mode = "single_pass"
+
+        # Capture only the union of the ROIs the active state needs,
+        # padded by capture_margin (the largest search radius in use)
+        self.roi_capture = True
+        self.capture_margin = 5
+
+        # Worker threads for Detector.find_many (1 matches serially)
+        self.match_threads = 4
+
+        # Templates without a ROI are searched over the whole frame. With
+        # "pyramid" a downscaled pass finds up to pyramid_candidates peaks
+        # (scoring at least precision - pyramid_coarse_margin), and only
+        # those are matched again at full resolution. "direct" matches the
+        # full-resolution frame in one go.
+        self.full_frame_search = "pyramid"
+        self.pyramid_scale = 0.5
+        self.pyramid_candidates = 3
+        self.pyramid_coarse_margin = 0.15
+
+        # Look for a template around its last match first, in a window
+        # track_margin pixels larger than the template, before searching the
+        # whole ROI (and radius)
+        self.track_last_hit = True
+        self.track_margin = 2
+
+        # Reuse the previous result of a template while its search region is
+        # unchanged: mean absolute difference of a downsampled copy below
+        # change_gate_threshold gray levels, for at most change_gate_max_age s
+        self.change_gate = True
+        self.change_gate_threshold = 2.0
+        self.change_gate_max_age = 0.5
+
+        # Intensity prefilter: reject a template without matching when its
+        # search area lacks prefilter_min_ratio of the template's pixels in
+        # the template's dominant gray levels (32 bins, +/- the tolerance)
+        self.prefilter_min_ratio = 0.5
+        self.prefilter_bin_tolerance = 4
+
+        # Per-template detection settings:
+        #   threshold: confidence required for a match (default: precision)
+        #   method: "ccoeff_normed" (default), "ccorr_normed" or
+        #     "sqdiff_normed"; all score higher-is-better from 0 to 1
+        #   use_mask: match with the PNG's alpha mask (default True). Masked
+        #     matching is slower, but most masked templates lose their
+        #     separation from the background without it
+        #   radius_search_mode, full_frame_search, track_last_hit: override
+        #     the globals above
+        #   prefilter: run the intensity prefilter before matching
+        #   strategy: "template" (default) or "color_threshold", which looks
+        #     for a blob of hsv_lower..hsv_upper pixels at least
+        #     min_component_ratio the size of the template's own blob, and
+        #     only runs the template match to confirm it when confirm is set
+        self.template_settings = {
+            "success": {"prefilter": True},
+            "failure": {"prefilter": True},
+            "exclamation": {
+                "strategy": "color_threshold",
+                "hsv_lower": (5, 150, 180),
+                "hsv_upper": (30, 255, 255),
+                "min_component_ratio": 0.5,
+                "confirm": True,
+            },
+        }
+
         self.templates_path = str(TEMPLATES_PATH)
 
+        # Keep decoded templates in src/bot/.cache, keyed by a hash of each
+        # PNG, so later startups skip decoding them
+        self.template_cache = True
+
         self.templates = {
             "fishing_spot_btn": "fishing_spot_btn.png",
             "broken_rod": "broken_rod.png",
@@ -37,6 +109,21 @@ class DetectionConfig:
         #     "level_check": None
         # }
 
+        # The ROIs and click points below are authored for this client
+        # size; the detector scales them (and the templates) at startup to
+        # the detected window size
+        self.base_resolution = (1920, 1080)
+
+        # Fixed positions the bot clicks that have no template of their own
+        self.click_points = {
+            "new_rod": (1650, 580),
+            "connect_server": (1100, 795),
+        }
+
+        # Replace the ROIs below with those measured by the calibration tool
+        # (src/bot/tools/calibrate.py) for the current window size, if any
+        self.use_calibration = True
+
         #FullHD 1080p Config
         self.rois = {
             "fishing_spot_btn": (1400, 540, 121, 55),
@@ -1,10 +1,7 @@
 from typing import Dict, Any
 from .base_config import BaseConfig
 
-try:
-    from .screen_config import ScreenConfig
-except ImportError:
-    from .screen_config_safe import ScreenConfig
+from .screen_config import ScreenConfig
 from .detection_config import DetectionConfig
 # from ..framework.registration import register_config  # Removed to avoid circular import
 
@@ -74,6 +71,9 @@ class FishingConfig(BaseConfig):
             "quick_finish_enabled",
             "casting_delay",
             "finish_wait_delay",
+            "threaded_capture",
+            "capture_fps",
+            "record_path",
         ]:
             if key in data:
                 setattr(config, key, data[key])
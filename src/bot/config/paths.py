@@ -2,4 +2,9 @@ from pathlib import Path
 
 PACKAGE_ROOT = Path(__file__).resolve().parent.parent
 ASSETS_PATH = PACKAGE_ROOT / "assets"
-TEMPLATES_PATH = ASSETS_PATH / "templates"
\ No newline at end of file
+TEMPLATES_PATH = ASSETS_PATH / "templates"
+# Calibrated ROIs written by `python -m src.bot.tools.calibrate`
+CALIBRATION_PATH = PACKAGE_ROOT / "calibration.json"
+
+# Decoded templates, keyed by a hash of their PNG (safe to delete)
+TEMPLATE_CACHE_PATH = PACKAGE_ROOT / ".cache" / "templates"
@@ -1,29 +1,25 @@
-import pywinctl as pwc
+from ..utils.window_tracker import WindowTracker
+
 
 class ScreenConfig:
-    def __init__(self):
-        self.window_title = "Blue Protocol: Star Resonance"
-        self.monitor_x = 0
-        self.monitor_y = 0
-        self.monitor_width = 1920
-        self.monitor_height = 1080
+    """
+    Game window geometry, read from the shared WindowTracker, so only the
+    first ScreenConfig of a process has to look for the window.
 
-        windows = pwc.getAllWindows()
+    follow_window lets the detector keep monitor_* in sync with window
+    moves; turn it off when setting the geometry by hand.
+    """
 
-        for window in windows:
-            if "Blue Protocol" in window.title:
-                (self.monitor_x, self.monitor_y) = window.topleft
-                (self.monitor_width, self.monitor_height) = window.size
-                
+    def __init__(self):
+        self.window_title = "Blue Protocol: Star Resonance"
+        self.tracker = WindowTracker.shared()
+        self.follow_window = True
+        self.update(self.tracker.geometry)
 
-                if self.monitor_x > 0 or self.monitor_y > 0:
-                    self.monitor_y = self.monitor_y + 32 # windowed mode so adjust down for top bar
-                    self.monitor_x = self.monitor_x + 8
-                    self.monitor_width = self.monitor_width - 16
-                    self.monitor_height = self.monitor_height - 39
+    def update(self, geometry):
+        """Take the position and size of a WindowGeometry"""
+        self.monitor_x, self.monitor_y, self.monitor_width, self.monitor_height = geometry
 
-                    print(f"game window detected at ({self.monitor_x}, {self.monitor_y})")
-                    print(f"width and height ({self.monitor_width}, {self.monitor_height})")
-                break 
-        else:
-            print("Window not found. using defaults.")
+    def close(self):
+        """Stop the tracker's background poll; the next detector that follows the window restarts it"""
+        self.tracker.stop()
@@ -13,6 +13,7 @@ from .state.impl.waiting_for_bite_state import WaitingForBiteState
 from .state.state_machine import StateMachine
 from .state.state_type import StateType
 from .stats import StatsTracker
+from ..shared.frame_scheduler import FrameScheduler
 from ...utils.logger import log
 
 
@@ -31,9 +32,7 @@ class FishingBot:
         self._stopped = False
         self.debug_mode = self.config.bot.debug_mode
 
-        self.target_delay = 0
-        if self.config.bot.target_fps > 0:
-            self.target_delay = 1.0 / self.config.bot.target_fps
+        self.scheduler = FrameScheduler(self.config.bot.target_fps)
 
         self._register_states()
 
@@ -58,16 +57,13 @@ class FishingBot:
         if self._stopped:
             return
 
-        loop_start = time.time()
+        self.scheduler.begin()
 
         screen = self.detector.capture_screen()
         self.state_machine.handle(screen)
 
-        if self.target_delay > 0:
-            loop_time = time.time() - loop_start
-            sleep_time = max(0, self.target_delay - loop_time)
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+        state = self.state_machine.current_state
+        self.scheduler.pace(self.state_machine.current_state_name, state.get_poll_rate())
 
     def stop(self):
         # Always show stats once
@@ -79,6 +75,8 @@ class FishingBot:
         if not self._stopped:
             self.log("[BOT] 🛑 Shutting down the bot...")
             self._stopped = True
+            self.detector.close()
+            self.scheduler.log_summary()
 
             try:
                 self.controller.release_all_controls()
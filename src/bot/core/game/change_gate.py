@@ -0,0 +1,50 @@
+import cv2 as cv
+import numpy as np
+
+
+class ChangeGate:
+    """
+    Skips template matching while a search region's pixels stay the same.
+
+    Each lookup key (template and radius) remembers a small downsampled
+    signature of the region it last searched, plus the result of that search.
+    If the mean absolute difference between the current signature and the
+    stored one is below the threshold, the stored result is reused. A result
+    is never reused for longer than max_age seconds.
+    """
+
+    def __init__(self, threshold=2.0, max_age=0.5, size=32):
+        self.threshold = threshold
+        self.max_age = max_age
+        self.size = size
+        self._entries = {}
+        self.stats = {"hits": 0, "misses": 0}
+
+    def signature(self, gray):
+        """Downsampled float copy of a grayscale region"""
+        h, w = gray.shape[:2]
+        size = (min(self.size, w), min(self.size, h))
+        return cv.resize(gray, size, interpolation=cv.INTER_AREA).astype(np.float32)
+
+    def lookup(self, key, rect, signature, timestamp):
+        """Return (True, result) when the cached result is still valid"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            cached_rect, cached_signature, result, cached_at = entry
+            if (
+                cached_rect == rect
+                and cached_signature.shape == signature.shape
+                and 0 <= timestamp - cached_at <= self.max_age
+                and cv.norm(signature, cached_signature, cv.NORM_L1) / signature.size < self.threshold
+            ):
+                self.stats["hits"] += 1
+                return True, result
+
+        self.stats["misses"] += 1
+        return False, None
+
+    def store(self, key, rect, signature, result, timestamp):
+        self._entries[key] = (rect, signature, result, timestamp)
+
+    def clear(self):
+        self._entries.clear()
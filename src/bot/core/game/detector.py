@@ -1,54 +1,152 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+
 import cv2 as cv
 import numpy as np
 
+from ...config.calibration import load_calibration
+from ...config.paths import TEMPLATE_CACHE_PATH
 from ...utils.logger import log
+from .change_gate import ChangeGate
+from .frame import Frame
+from .scaling import ResolutionScaler
+from .template_bank import TemplateBank
+
 
-try:
-    import mss
-except ImportError:
-    log("[ERROR] ❌ MSS library not found! Install with: pip install mss")
-    log("[ERROR] The bot cannot run without MSS.")
-    exit(1)
+def _open_mss():
+    """mss is only needed for live capture, so it is imported on first use"""
+    try:
+        import mss
+    except ImportError:
+        log("[ERROR] ❌ MSS library not found! Install with: pip install mss")
+        raise
+    return mss.mss()
 
 
 class Detector:
+    # Shared by every detector; matchTemplate releases the GIL, so the
+    # matches of a multi-template check can run on idle cores.
+    _match_pool = None
+    _match_pool_lock = threading.Lock()
+
     def __init__(self, config):
         self.unified_config = config
         self.detection_config = config.bot.detection
         self.screen_config = config.bot.screen
 
-        self.templates = self._load_templates()
-        self.sct = None
-        self.monitor = {
+        # Follow moves and resizes of the game window
+        self._window_changed = False
+        self._tracker = None
+        tracker = getattr(self.screen_config, 'tracker', None)
+        if tracker is not None and getattr(self.screen_config, 'follow_window', False):
+            self.screen_config.update(tracker.geometry)
+            tracker.subscribe(self._on_window_change)
+            tracker.start()
+            self._tracker = tracker
+
+        self.monitor = self._screen_monitor()
+        self._apply_layout()
+        self.change_gate = None
+        if self.detection_config.change_gate:
+            self.change_gate = ChangeGate(
+                self.detection_config.change_gate_threshold,
+                self.detection_config.change_gate_max_age,
+            )
+        # Center of each template's most recent match, searched first
+        self._last_hits = {}
+        self.tracking_stats = {"hits": 0, "misses": 0}
+        self._thread_local = threading.local()
+        self._capture_regions = {}
+        self._gray_buffers = {}
+
+    def _screen_monitor(self):
+        return {
             'left': self.screen_config.monitor_x,
             'top': self.screen_config.monitor_y,
             'width': self.screen_config.monitor_width,
             'height': self.screen_config.monitor_height
         }
 
+    def _apply_layout(self):
+        """Scale templates, ROIs and click points to the monitor size"""
+        self.scaler = ResolutionScaler(
+            self.detection_config.base_resolution, self.monitor['width'], self.monitor['height']
+        )
+        if not self.scaler.is_identity:
+            base_w, base_h = self.detection_config.base_resolution
+            log(f"[INFO] 📐 Scaling {base_w}x{base_h} layout to {self.scaler.width}x{self.scaler.height}")
+
+        self.templates = self._load_templates()
+        self.rois = self.scaler.scale_rois(
+            self.detection_config.rois,
+            {name: self.templates.size(name) for name in self.detection_config.templates}
+        )
+        if self.detection_config.use_calibration:
+            calibrated = load_calibration(self.monitor['width'], self.monitor['height'])
+            if calibrated:
+                self.rois.update(calibrated)
+                log(f"[INFO] 📏 Using calibrated ROIs for {len(calibrated)} templates")
+        self.click_points = {
+            name: self.scaler.scale_point(point)
+            for name, point in self.detection_config.click_points.items()
+        }
+
+    def close(self):
+        """Stop following the game window"""
+        tracker, self._tracker = self._tracker, None
+        if tracker is not None:
+            tracker.unsubscribe(self._on_window_change)
+            self.screen_config.close()
+
+    def _on_window_change(self, geometry):
+        """WindowTracker callback; the change is applied by the next capture"""
+        self._window_changed = True
+
+    def _follow_window(self):
+        """
+        Take the tracker's current geometry. A move only shifts the capture
+        area; a resize rescales the layout and drops everything that
+        depended on the old one. Either way, results cached by the change
+        gate were seen at the old place and are searched for again.
+        """
+        self._window_changed = False
+        self.screen_config.update(self.screen_config.tracker.geometry)
+        monitor = self._screen_monitor()
+        resized = (monitor['width'], monitor['height']) != (self.monitor['width'], self.monitor['height'])
+        self.monitor = monitor
+        if self.change_gate:
+            self.change_gate.clear()
+        if not resized:
+            return
+
+        self._apply_layout()
+        self._capture_regions = {}
+        self._last_hits = {}
+
     def _load_templates(self):
-        loaded = {}
-        log("[INFO] 📦 Loading templates...")
-        for name in self.detection_config.templates:
-            path = self.unified_config.get_template_path(name)
-            if not (path and path.exists()):
-                log(f"[INFO] ❌ {name} - not found at '{path}'")
-                continue
+        """Templates are compiled on first use; see TemplateBank"""
+        names = list(self.detection_config.templates)
+        log(f"[INFO] 📦 {len(names)} templates registered, loaded on first use")
+        return TemplateBank(
+            {name: self.unified_config.get_template_path(name) for name in names},
+            pyramid_scale=self.detection_config.pyramid_scale,
+            scale=self.scaler.template_scale,
+            settings={name: self._template_settings(name) for name in names},
+            cache_dir=TEMPLATE_CACHE_PATH if self.detection_config.template_cache else None,
+        )
 
-            img = cv.imread(str(path), cv.IMREAD_UNCHANGED)
-            template_img, mask = None, None
+    def _template_settings(self, name):
+        """A template's entry from template_settings over the global defaults"""
+        settings = {
+            "threshold": self.detection_config.precision,
+            "radius_search_mode": self.detection_config.radius_search_mode,
+            "full_frame_search": self.detection_config.full_frame_search,
+            "track_last_hit": self.detection_config.track_last_hit,
+        }
+        settings.update(self.detection_config.template_settings.get(name, {}))
+        return settings
 
-            if img.shape[2] == 4:
-                log(f"[INFO] ✅ {name} (with transparency mask)")
-                mask = img[:, :, 3]
-                template_img = cv.cvtColor(img, cv.COLOR_BGRA2BGR)
-            else:
-                log(f"[INFO] ✅ {name}")
-                template_img = img
-            
-            loaded[name] = (template_img, mask)
-        return loaded
-    
     def _generate_concentric_square_pixels(self, center_x, center_y, max_radius):
         """
         Generates x, y pixel coordinates for the perimeters of concentric squares.
@@ -77,22 +175,104 @@ class Detector:
             for y in range(center_y - r + 1, center_y + r):
                 yield center_x + r, y
 
-    def capture_screen(self):
-        if self.sct is None:
-            self.sct = mss.mss()
-            log("[INFO] ✅ MSS initialized in bot thread")
+    def _resolve_roi(self, template_name):
+        roi_config = self.rois.get(template_name)
+        if isinstance(roi_config, str):
+            return self.rois.get(roi_config)
+        return roi_config
 
-        screenshot = self.sct.grab(self.monitor)
-        img = np.array(screenshot)
-        return cv.cvtColor(img, cv.COLOR_BGRA2BGR)
+    def click_point(self, name):
+        """Absolute screen position of a configured click point"""
+        x, y = self.click_points[name]
+        return x + self.screen_config.monitor_x, y + self.screen_config.monitor_y
 
-    def _check_xy(self, search_area, x, y, template_data, template_img, template_name, debug):
-        confidence, location = self._perform_match(search_area, template_data)
+    def _capture_region(self, templates):
+        """
+        Bounding union of the ROIs of the given templates, padded by the
+        capture margin and clamped to the monitor. Returns None when the
+        full screen is needed (no templates, or one of them has no ROI).
+        """
+        if not templates or not self.detection_config.roi_capture:
+            return None
+
+        key = tuple(templates)
+        if key in self._capture_regions:
+            return self._capture_regions[key]
+
+        rois = [self._resolve_roi(name) for name in templates]
+        region = None
+        if all(rois):
+            margin = self.detection_config.capture_margin
+            left = max(0, min(x for x, _, _, _ in rois) - margin)
+            top = max(0, min(y for _, y, _, _ in rois) - margin)
+            right = min(self.monitor['width'], max(x + w for x, _, w, _ in rois) + margin)
+            bottom = min(self.monitor['height'], max(y + h for _, y, _, h in rois) + margin)
+            if right > left and bottom > top:
+                region = (left, top, right - left, bottom - top)
+
+        self._capture_regions[key] = region
+        return region
+
+    @property
+    def sct(self):
+        """The mss instance owned by the calling thread"""
+        return getattr(self._thread_local, 'sct', None)
+
+    @sct.setter
+    def sct(self, value):
+        self._thread_local.sct = value
+
+    def capture_screen(self, templates=None, gray_buffers=None):
+        """
+        Grab the screen as a Frame. When templates are given, only the
+        union of their ROIs is captured; coordinates stay screen-relative.
+
+        gray_buffers is the pool of preallocated grayscale buffers to
+        convert into, keyed by size; it defaults to the detector's own.
+        """
+        if self._window_changed:
+            self._follow_window()
+
+        if self.sct is None:
+            self.sct = _open_mss()
+            log(f"[INFO] ✅ MSS initialized in {threading.current_thread().name}")
+
+        region = self._capture_region(templates)
+        if region is None:
+            monitor, origin = self.monitor, (0, 0)
+        else:
+            x, y, w, h = region
+            monitor = {
+                'left': self.monitor['left'] + x,
+                'top': self.monitor['top'] + y,
+                'width': w,
+                'height': h
+            }
+            origin = (x, y)
+
+        screenshot = self.sct.grab(monitor)
+
+        # Wrap the mss buffer without copying and convert it straight to
+        # gray into a buffer reused across frames of the same size. BGR is
+        # only derived later if a caller needs color.
+        bgra = np.frombuffer(screenshot.raw, dtype=np.uint8).reshape(screenshot.height, screenshot.width, 4)
+        if gray_buffers is None:
+            gray_buffers = self._gray_buffers
+        gray = gray_buffers.get((screenshot.height, screenshot.width))
+        if gray is None:
+            gray = np.empty((screenshot.height, screenshot.width), dtype=np.uint8)
+            gray_buffers[(screenshot.height, screenshot.width)] = gray
+
+        cv.cvtColor(bgra, cv.COLOR_BGRA2GRAY, dst=gray)
+        return Frame(bgra=bgra, gray=gray, origin=origin)
+
+    def _check_xy(self, search_gray, x, y, template, template_name, debug):
+        confidence, location = self._perform_match(search_gray, template)
 
         if confidence is None:
             return None
         
-        precision = self.detection_config.precision
+        precision = template.threshold
         is_match = confidence >= precision
 
         if debug and confidence >= .3:
@@ -100,32 +280,44 @@ class Detector:
             log(f"[DEBUG] [{template_name}] at ({x}, {y}) Confidence: {confidence:.2%} (required: {precision:.0%}) -> {status}")
 
         if is_match:
-            return self._calculate_center(location, template_img.shape[:2], (x, y))
+            return self._calculate_center(location, template.shape, (x, y))
 
         return None
 
-    def _get_search_area(self, screen, template_name, radius, debug):
-        template_data = self.templates[template_name]
-        template_img, _ = template_data
+    def _get_search_area(self, frame, template_name, radius, debug):
+        template = self.templates[template_name]
 
-        roi_config = self.detection_config.rois.get(template_name)
-        if isinstance(roi_config, str):
-            roi = self.detection_config.rois.get(roi_config)
-        else:
-            roi = roi_config
+        roi = self._resolve_roi(template_name)
+
+        if roi and template.strategy == "color_threshold":
+            # The template match below only runs to confirm a color hit
+            center = self._find_by_color(frame, roi, radius, template, template_name, debug)
+            if center is None or not template.color_confirm:
+                return center
+
+        if template.track_last_hit and template_name in self._last_hits:
+            center = self._search_last_hit(frame, roi, radius, template, template_name, debug)
+            if center is not None:
+                return center
 
         if not roi:
-            return screen, (0, 0)
+            if template.full_frame_search == "pyramid" and template.coarse is not None:
+                return self._search_pyramid(frame, template, template_name, debug)
+            return self._check_xy(
+                frame.gray_crop(frame.left, frame.top, frame.right - frame.left, frame.bottom - frame.top),
+                frame.left, frame.top, template, template_name, debug
+            )
 
-        x, y, w, h = roi
-        screen_h, screen_w = screen.shape[:2]
-        x = max(0, min(x, screen_w - 1))
-        y = max(0, min(y, screen_h - 1))
-        w = min(w, screen_w - x)
-        h = min(h, screen_h - y)
+        x, y, w, h = frame.clamp(*roi)
+
+        if w > 0 and h > 0 and template.prefilter and not self._passes_prefilter(frame, x, y, w, h, radius, template, template_name, debug):
+            return None
+
+        if w > 0 and h > 0 and radius > 0 and template.radius_search_mode == "single_pass":
+            return self._search_padded_roi(frame, x, y, w, h, radius, template, template_name, debug)
 
         if w > 0 and h > 0:
-            result = self._check_xy(screen[y:y + h, x:x + w], x, y, template_data, template_img, template_name, debug)
+            result = self._check_xy(frame.gray_crop(x, y, w, h), x, y, template, template_name, debug)
 
             if result != None:
                 return result
@@ -136,23 +328,202 @@ class Detector:
                 for pixel in list(concentric_coords):
                     x, y = pixel
 
-                    result = self._check_xy(screen[y:y + h, x:x + w], x, y, template_data, template_img, template_name, debug)
+                    result = self._check_xy(frame.gray_crop(x, y, w, h), x, y, template, template_name, debug)
 
                     if result != None:
                         return result
 
         return None
 
-    def _perform_match(self, search_area, template_data):
-        template_img, mask = template_data
+    def _search_last_hit(self, frame, roi, radius, template, template_name, debug):
+        """
+        Match a small window around the template's previous position. The
+        window never reaches outside the area the caller asked to search.
+        """
+        center_x, center_y = self._last_hits[template_name]
+        margin = self.detection_config.track_margin
+        x = center_x - self.screen_config.monitor_x - template.width // 2 - margin
+        y = center_y - self.screen_config.monitor_y - template.height // 2 - margin
+        right = x + template.width + 2 * margin
+        bottom = y + template.height + 2 * margin
+
+        if roi:
+            roi_x, roi_y, roi_w, roi_h = roi
+            area = frame.clamp(roi_x - radius, roi_y - radius, roi_w + 2 * radius, roi_h + 2 * radius)
+        else:
+            area = (frame.left, frame.top, frame.right - frame.left, frame.bottom - frame.top)
+        x = max(x, area[0])
+        y = max(y, area[1])
+        right = min(right, area[0] + area[2])
+        bottom = min(bottom, area[1] + area[3])
+        if right - x < template.width or bottom - y < template.height:
+            return None
+
+        confidence, location = self._perform_match(frame.gray_crop(x, y, right - x, bottom - y), template)
+
+        # A peak on the edge of the window may be the slope of a stronger
+        # one just outside it (the template moved), so only accept interior
+        # peaks, or edges the full search could not go past either
+        max_col = right - x - template.width
+        max_row = bottom - y - template.height
+        col, row = location
+        inside = (
+            (0 < col or x == area[0]) and (col < max_col or right == area[0] + area[2])
+            and (0 < row or y == area[1]) and (row < max_row or bottom == area[1] + area[3])
+        )
+        if confidence < template.threshold or not inside:
+            self.tracking_stats["misses"] += 1
+            return None
+
+        self.tracking_stats["hits"] += 1
+        center = self._calculate_center(location, template.shape, (x, y))
+        if debug:
+            log(f"[DEBUG] [{template_name}] at its last position {center} Confidence: {confidence:.2%} -> MATCH")
+        return center
+
+    def _find_by_color(self, frame, roi, radius, template, template_name, debug):
+        """
+        Classify the ROI (padded by the radius) by an HSV threshold and the
+        size of the largest connected blob. Returns the blob's center, or
+        None when the template is absent.
+        """
+        x, y, w, h = roi
+        x, y, w, h = frame.clamp(x - radius, y - radius, w + 2 * radius, h + 2 * radius)
+        if w <= 0 or h <= 0:
+            return None
+
+        area, centroid = template.largest_color_component(frame.bgr_crop(x, y, w, h))
+        if area < template.min_component_pixels:
+            return None
+
+        if debug:
+            log(f"[DEBUG] [{template_name}] color blob of {area}px (required: {template.min_component_pixels}px)")
+
+        return (
+            int(centroid[0]) + x + self.screen_config.monitor_x,
+            int(centroid[1]) + y + self.screen_config.monitor_y
+        )
+
+    def _passes_prefilter(self, frame, x, y, w, h, radius, template, template_name, debug):
+        area = frame.clamp(x - radius, y - radius, w + 2 * radius, h + 2 * radius)
+        if template.passes_prefilter(
+            frame.gray_crop(*area),
+            self.detection_config.prefilter_min_ratio,
+            self.detection_config.prefilter_bin_tolerance
+        ):
+            return True
+
+        if debug:
+            log(f"[DEBUG] [{template_name}] rejected by prefilter")
+        return False
+
+    def _search_padded_roi(self, frame, x, y, w, h, radius, template, template_name, debug):
+        """
+        Radius search with a single matchTemplate call.
+
+        The ROI is padded by the radius on every side and matched once. The
+        result map is then walked in the same order as the concentric-square
+        loop (ROI first, then each offset), so the returned center is the one
+        the per-offset search would have found.
+        """
+        pad_x = max(frame.left, x - radius)
+        pad_y = max(frame.top, y - radius)
+        pad_w = min(frame.right, x + w + radius) - pad_x
+        pad_h = min(frame.bottom, y + h + radius) - pad_y
+
+        if pad_h < template.height or pad_w < template.width:
+            return None
+
+        search_gray = frame.gray_crop(pad_x, pad_y, pad_w, pad_h)
+        result = template.match(search_gray)
+        _, best, _, _ = cv.minMaxLoc(result)
+
+        precision = template.threshold
+        if best < precision:
+            if debug and best >= .3:
+                log(f"[DEBUG] [{template_name}] within radius {radius} of ({x}, {y}) Confidence: {best:.2%} (required: {precision:.0%}) -> NO MATCH")
+            return None
+
+        offsets = [(0, 0)] + list(self._generate_concentric_square_pixels(0, 0, radius))
+        for dx, dy in offsets:
+            area_x, area_y = x + dx, y + dy
+            if area_x < pad_x or area_y < pad_y:
+                continue
+
+            # Result cells whose template window lies inside the shifted ROI
+            col = area_x - pad_x
+            row = area_y - pad_y
+            cols = min(area_x + w, frame.right) - area_x - template.width + 1
+            rows = min(area_y + h, frame.bottom) - area_y - template.height + 1
+            if cols <= 0 or rows <= 0:
+                continue
+
+            _, confidence, _, location = cv.minMaxLoc(result[row:row + rows, col:col + cols])
+            if confidence >= precision:
+                if debug:
+                    log(f"[DEBUG] [{template_name}] at ({area_x}, {area_y}) Confidence: {confidence:.2%} (required: {precision:.0%}) -> MATCH")
+                return self._calculate_center(location, template.shape, (area_x, area_y))
+
+        return None
+
+    def _search_pyramid(self, frame, template, template_name, debug):
+        """
+        Coarse-to-fine search of the whole frame for templates without a ROI.
 
-        search_gray = cv.cvtColor(search_area, cv.COLOR_BGR2GRAY)
-        template_gray = cv.cvtColor(template_img, cv.COLOR_BGR2GRAY)
+        The downscaled template is matched against the downscaled frame, the
+        strongest peaks become candidates, and only a small window around
+        each candidate is matched again at full resolution.
+        """
+        scale = template.pyramid_scale
+        coarse = template.coarse
+        small_gray = frame.downscaled_gray(scale)
+        if small_gray.shape[0] < coarse.height or small_gray.shape[1] < coarse.width:
+            return None
+
+        result = coarse.match(small_gray)
+
+        precision = template.threshold
+        coarse_threshold = precision - self.detection_config.pyramid_coarse_margin
+        margin = int(np.ceil(1 / scale)) + 2
+        best = None
+
+        for _ in range(self.detection_config.pyramid_candidates):
+            _, coarse_confidence, _, (cx, cy) = cv.minMaxLoc(result)
+            if coarse_confidence < coarse_threshold:
+                break
+
+            # Suppress this peak so the next candidate is a different spot
+            result[max(0, cy - coarse.height // 2):cy + coarse.height // 2 + 1,
+                   max(0, cx - coarse.width // 2):cx + coarse.width // 2 + 1] = -1.0
+
+            x, y, w, h = frame.clamp(
+                frame.left + int(cx / scale) - margin,
+                frame.top + int(cy / scale) - margin,
+                template.width + 2 * margin,
+                template.height + 2 * margin
+            )
+            confidence, location = self._perform_match(frame.gray_crop(x, y, w, h), template)
+            if confidence is not None and (best is None or confidence > best[0]):
+                best = (confidence, location, x, y)
+
+        if best is None:
+            return None
 
-        if search_gray.shape[0] < template_gray.shape[0] or search_gray.shape[1] < template_gray.shape[1]:
+        confidence, location, x, y = best
+        is_match = confidence >= precision
+        if debug and confidence >= .3:
+            status = 'MATCH' if is_match else 'NO MATCH'
+            log(f"[DEBUG] [{template_name}] pyramid candidate at ({x}, {y}) Confidence: {confidence:.2%} (required: {precision:.0%}) -> {status}")
+
+        if is_match:
+            return self._calculate_center(location, template.shape, (x, y))
+        return None
+
+    def _perform_match(self, search_gray, template):
+        if search_gray.shape[0] < template.height or search_gray.shape[1] < template.width:
             return None, None
 
-        result = cv.matchTemplate(search_gray, template_gray, cv.TM_CCOEFF_NORMED, mask=mask)
+        result = template.match(search_gray)
         _, confidence, _, location = cv.minMaxLoc(result)
         return confidence, location
 
@@ -164,30 +535,186 @@ class Detector:
             location[1] + h_t // 2 + offset_y + self.screen_config.monitor_y
         )
 
+    @classmethod
+    def _get_match_pool(cls, workers):
+        with cls._match_pool_lock:
+            if cls._match_pool is None:
+                cls._match_pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="Matcher")
+            return cls._match_pool
+
+    def find_many(self, screen, templates, radius=0, first_match=False, debug=False):
+        """
+        Look for several templates in the same frame on the shared thread pool.
+
+        Args:
+            screen: Frame (or BGR array) to search.
+            templates: Template names, or (name, radius) pairs to override
+                the default radius per template.
+            radius: Radius used for plain template names.
+            first_match: Stop at the first template, in list order, that
+                matches. Lookups that have not started yet are skipped;
+                those already running are waited for.
+
+        Returns:
+            With first_match, a (name, position) tuple for the first template
+            in list order that matched, or None. Otherwise a dict mapping each
+            name to its position, or None when it was not found.
+        """
+        specs = [(t, radius) if isinstance(t, str) else tuple(t) for t in templates]
+        frame = Frame.wrap(screen)
+        workers = min(self.detection_config.match_threads, os.cpu_count() or 1)
+
+        if workers > 1 and len(specs) > 1:
+            frame.gray  # convert once before workers share the frame
+            pool = self._get_match_pool(workers)
+            futures = [pool.submit(self.find, frame, name, r, debug) for name, r in specs]
+            results = (future.result() for future in futures)
+        else:
+            futures = []
+            results = (self.find(frame, name, r, debug) for name, r in specs)
+
+        if not first_match:
+            return {name: result for (name, _), result in zip(specs, results)}
+
+        for (name, _), result in zip(specs, results):
+            if result is not None:
+                # Lookups already running can't be cancelled; wait for them,
+                # since they update _last_hits and the change gate and read
+                # the frame, whose buffers the caller may reuse
+                for future in futures:
+                    future.cancel()
+                wait(futures)
+                return name, result
+        return None
+
     def find(self, screen, template_name, radius = 0, debug=False):
         if template_name not in self.templates:
             log(f"[INFO] ❌ Template '{template_name}' was not loaded.")
             return None
-        
-        return self._get_search_area(screen, template_name, radius, debug)
 
-        # template_data = self.templates[template_name]
-        # template_img, _ = template_data
+        frame = Frame.wrap(screen)
+        key = (template_name, radius)
+        if key not in frame.results:
+            result = self._find_gated(frame, template_name, radius, debug)
+            if result is not None:
+                self._last_hits[template_name] = result
+            frame.results[key] = result
+        return frame.results[key]
 
-        # search_area, offset = self._get_search_area(screen, template_name)
-        # confidence, location = self._perform_match(search_area, template_data)
+    def score(self, screen, template_name, radius=0):
+        """
+        Best confidence of a template anywhere in its search area (its ROI
+        padded by radius, or the whole frame), before any threshold is
+        applied. Meant for tuning thresholds offline; returns None when the
+        template does not fit in the search area.
+        """
+        frame = Frame.wrap(screen)
+        roi = self._resolve_roi(template_name)
+        if roi:
+            x, y, w, h = roi
+            area = frame.clamp(x - radius, y - radius, w + 2 * radius, h + 2 * radius)
+        else:
+            area = (frame.left, frame.top, frame.right - frame.left, frame.bottom - frame.top)
+        if area[2] <= 0 or area[3] <= 0:
+            return None
 
-        # if confidence is None:
-        #     return None
+        confidence, _ = self._perform_match(frame.gray_crop(*area), self.templates[template_name])
+        return confidence
 
-        # precision = self.detection_config.precision
-        # is_match = confidence >= precision
+    def find_direction(self, screen, left="left_arrow", right="right_arrow", debug=False):
+        """
+        Decide which of two mutually exclusive direction templates is showing.
+
+        Both templates are matched within their own ROIs, cut from a single
+        crop of the strip covering the two. When both clear their
+        thresholds, the more confident one wins, so callers never see both
+        directions at once.
+
+        Returns:
+            (direction, left_confidence, right_confidence), where direction is
+            "left", "right" or None. A confidence is None when its template
+            could not be matched.
+        """
+        frame = Frame.wrap(screen)
+        key = ("direction", left, right)
+        if key not in frame.results:
+            frame.results[key] = self._find_direction(frame, left, right, debug)
+        return frame.results[key]
+
+    def _find_direction(self, frame, left, right, debug):
+        for name in (left, right):
+            if name not in self.templates:
+                log(f"[INFO] ❌ Template '{name}' was not loaded.")
+                return None, None, None
+
+        full = (frame.left, frame.top, frame.right - frame.left, frame.bottom - frame.top)
+        rois = [frame.clamp(*(self._resolve_roi(name) or full)) for name in (left, right)]
+        # A ROI outside a partial frame is simply not searched
+        rois = [roi if roi[2] > 0 and roi[3] > 0 else None for roi in rois]
+        visible = [roi for roi in rois if roi is not None]
+        if not visible:
+            return None, None, None
+        strip_x = min(x for x, _, _, _ in visible)
+        strip_y = min(y for _, y, _, _ in visible)
+        strip_w = max(x + w for x, _, w, _ in visible) - strip_x
+        strip_h = max(y + h for _, y, _, h in visible) - strip_y
+        strip = (strip_x, strip_y, strip_w, strip_h)
+
+        def classify():
+            strip_gray = frame.gray_crop(*strip)
+            confidences = []
+            for name, roi in zip((left, right), rois):
+                if roi is None:
+                    confidences.append(None)
+                    continue
+                x, y, w, h = roi
+                x -= strip_x
+                y -= strip_y
+                confidence, _ = self._perform_match(strip_gray[y:y + h, x:x + w], self.templates[name])
+                confidences.append(confidence)
+
+            left_confidence, right_confidence = confidences
+            scores = {
+                direction: confidence
+                for direction, name, confidence in (
+                    ("left", left, left_confidence), ("right", right, right_confidence)
+                )
+                if confidence is not None and confidence >= self.templates[name].threshold
+            }
+            direction = max(scores, key=scores.get) if scores else None
+
+            if debug:
+                fmt = lambda c: "n/a" if c is None else f"{c:.2%}"
+                log(f"[DEBUG] [direction] left {fmt(left_confidence)}, right {fmt(right_confidence)} -> {direction}")
+
+            return direction, left_confidence, right_confidence
+
+        return self._gated(frame, ("direction", left, right), strip, classify)
+
+    def _find_gated(self, frame, template_name, radius, debug):
+        """Search unless the region is unchanged since the last search"""
+        roi = self._resolve_roi(template_name)
+        if roi:
+            x, y, w, h = roi
+            rect = frame.clamp(x - radius, y - radius, w + 2 * radius, h + 2 * radius)
+        else:
+            rect = (frame.left, frame.top, frame.right - frame.left, frame.bottom - frame.top)
+
+        return self._gated(
+            frame, (template_name, radius), rect,
+            lambda: self._get_search_area(frame, template_name, radius, debug)
+        )
 
-        # if debug:
-        #     status = 'MATCH' if is_match else 'NO MATCH'
-        #     log(f"[DEBUG] [{template_name}] Confidence: {confidence:.2%} (required: {precision:.0%}) -> {status}")
+    def _gated(self, frame, key, rect, search):
+        """Run search() unless rect is unchanged since the last search for key"""
+        if self.change_gate is None or rect[2] <= 0 or rect[3] <= 0:
+            return search()
 
-        # if is_match:
-        #     return self._calculate_center(location, template_img.shape[:2], offset)
+        signature = self.change_gate.signature(frame.gray_crop(*rect))
+        hit, result = self.change_gate.lookup(key, rect, signature, frame.timestamp)
+        if hit:
+            return result
 
-        # return None
\ No newline at end of file
+        result = search()
+        self.change_gate.store(key, rect, signature, result, frame.timestamp)
+        return result
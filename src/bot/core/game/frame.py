@@ -0,0 +1,123 @@
+import time
+
+import cv2 as cv
+
+
+class Frame:
+    """
+    A single captured screen shared by every state and interceptor in a loop.
+
+    The grayscale conversion, clamped ROI crops and per-template results are
+    computed on first use and memoized, so several lookups against the same
+    frame pay for each of them only once.
+
+    A frame can be built from a BGR image, or straight from the raw BGRA
+    capture buffer (optionally with its grayscale already converted). In the
+    latter case a BGR image is only produced if a caller asks for color.
+
+    A frame may cover only part of the screen. `origin` is the position of
+    the captured image in screen (monitor-relative) coordinates, and every
+    rectangle passed in or returned is expressed in those coordinates.
+    """
+
+    def __init__(self, bgr=None, timestamp=None, origin=(0, 0), bgra=None, gray=None):
+        source = next(img for img in (bgr, bgra, gray) if img is not None)
+        self.size = source.shape[:2]
+        self.timestamp = time.perf_counter() if timestamp is None else timestamp
+        self.origin = origin
+        self.results = {}
+        self._bgr = bgr
+        self._bgra = bgra
+        self._gray = gray
+        self._crops = {}
+        self._downscaled = {}
+        self._bgr_crops = {}
+
+    @classmethod
+    def wrap(cls, screen):
+        """Return screen as a Frame, wrapping raw BGR arrays"""
+        if isinstance(screen, cls):
+            return screen
+        return cls(screen)
+
+    @property
+    def shape(self):
+        return self.size
+
+    @property
+    def left(self):
+        return self.origin[0]
+
+    @property
+    def top(self):
+        return self.origin[1]
+
+    @property
+    def right(self):
+        return self.origin[0] + self.size[1]
+
+    @property
+    def bottom(self):
+        return self.origin[1] + self.size[0]
+
+    @property
+    def bgr(self):
+        if self._bgr is None:
+            self._bgr = cv.cvtColor(self._bgra, cv.COLOR_BGRA2BGR)
+        return self._bgr
+
+    @property
+    def gray(self):
+        if self._gray is None:
+            if self._bgra is not None:
+                self._gray = cv.cvtColor(self._bgra, cv.COLOR_BGRA2GRAY)
+            else:
+                self._gray = cv.cvtColor(self._bgr, cv.COLOR_BGR2GRAY)
+        return self._gray
+
+    def bgr_crop(self, x, y, w, h):
+        """
+        Color view of a rectangle in screen coordinates. When the frame was
+        captured as BGRA, only this rectangle is converted.
+        """
+        key = (x, y, w, h)
+        crop = self._bgr_crops.get(key)
+        if crop is None:
+            x -= self.left
+            y -= self.top
+            if self._bgr is None:
+                crop = cv.cvtColor(self._bgra[y:y + h, x:x + w], cv.COLOR_BGRA2BGR)
+            else:
+                crop = self._bgr[y:y + h, x:x + w]
+            self._bgr_crops[key] = crop
+        return crop
+
+    def downscaled_gray(self, scale):
+        """Grayscale image resized by scale, for coarse pyramid passes"""
+        small = self._downscaled.get(scale)
+        if small is None:
+            small = cv.resize(self.gray, None, fx=scale, fy=scale, interpolation=cv.INTER_AREA)
+            self._downscaled[scale] = small
+        return small
+
+    def clamp(self, x, y, w, h):
+        """
+        Intersect a rectangle with the captured area. The width or height
+        is <= 0 when the two do not overlap.
+        """
+        left = max(x, self.left)
+        top = max(y, self.top)
+        right = min(x + w, self.right)
+        bottom = min(y + h, self.bottom)
+        return left, top, right - left, bottom - top
+
+    def gray_crop(self, x, y, w, h):
+        """Return the grayscale view of a rectangle in screen coordinates"""
+        key = (x, y, w, h)
+        crop = self._crops.get(key)
+        if crop is None:
+            x -= self.left
+            y -= self.top
+            crop = self.gray[y:y + h, x:x + w]
+            self._crops[key] = crop
+        return crop
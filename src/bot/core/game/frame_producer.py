@@ -0,0 +1,132 @@
+import threading
+import time
+
+from ...utils.logger import log
+
+
+class FrameProducer:
+    """
+    Captures frames on a background thread so that capture overlaps with
+    matching on the bot thread.
+
+    Frames are converted into a small ring of preallocated grayscale buffers.
+    The consumer always receives the newest frame; anything captured in
+    between is dropped. The slot held by the consumer and the newest
+    published slot are never overwritten, so the ring needs at least three
+    slots.
+    """
+
+    def __init__(self, detector, buffer_count=3, max_fps=0, idle_timeout=0.5):
+        if buffer_count < 3:
+            raise ValueError("FrameProducer needs at least 3 buffers")
+
+        self.detector = detector
+        self.min_interval = 1.0 / max_fps if max_fps > 0 else 0
+        self.idle_timeout = idle_timeout
+
+        self._slots = [{} for _ in range(buffer_count)]
+        self._cond = threading.Condition()
+        self._thread = None
+        self._running = False
+
+        self._templates = None
+        self._last_request = 0.0
+        self._latest = None  # (frame, sequence, slot, templates)
+        self._sequence = 0
+        self._consumed_sequence = 0
+        self._held_slot = None
+
+        self.stats = {"captured": 0, "consumed": 0, "dropped": 0, "errors": 0}
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="FrameProducer", daemon=True)
+        self._thread.start()
+        log("[INFO] ✅ Frame producer thread started")
+
+    def stop(self):
+        if not self._running:
+            return
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        self._thread.join(timeout=1.0)
+        self._thread = None
+        log("[INFO] 🛑 Frame producer thread stopped")
+
+    def is_running(self):
+        return self._running
+
+    def get_frame(self, templates=None, timeout=1.0):
+        """
+        Return the newest frame captured for the given template set, waiting
+        for one that has not been consumed yet. Returns None on timeout.
+        """
+        key = tuple(templates) if templates else None
+        deadline = time.perf_counter() + timeout
+
+        with self._cond:
+            self._templates = key
+            self._last_request = time.perf_counter()
+            self._cond.notify_all()
+
+            while True:
+                latest = self._latest
+                if latest is not None and latest[1] > self._consumed_sequence and latest[3] == key:
+                    break
+
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0 or not self._running:
+                    return None
+                self._cond.wait(remaining)
+
+            frame, sequence, slot, _ = latest
+            if self._consumed_sequence:
+                self.stats["dropped"] += sequence - self._consumed_sequence - 1
+            self.stats["consumed"] += 1
+            self._consumed_sequence = sequence
+            self._held_slot = slot
+            return frame
+
+    def _next_slot(self):
+        busy = {self._held_slot}
+        if self._latest is not None:
+            busy.add(self._latest[2])
+        for offset in range(1, len(self._slots) + 1):
+            slot = (self._sequence + offset) % len(self._slots)
+            if slot not in busy:
+                return slot
+
+    def _run(self):
+        last_capture = 0.0
+        while True:
+            with self._cond:
+                # Idle while nobody is consuming (e.g. the bot is paused)
+                while self._running and time.perf_counter() - self._last_request > self.idle_timeout:
+                    self._cond.wait(0.1)
+                if not self._running:
+                    break
+                templates = self._templates
+                slot = self._next_slot()
+
+            if self.min_interval:
+                wait = last_capture + self.min_interval - time.perf_counter()
+                if wait > 0:
+                    time.sleep(wait)
+            last_capture = time.perf_counter()
+
+            try:
+                frame = self.detector.capture_screen(templates, gray_buffers=self._slots[slot])
+            except Exception as e:
+                self.stats["errors"] += 1
+                log(f"[ERROR] Frame capture failed: {e}")
+                time.sleep(0.1)
+                continue
+
+            with self._cond:
+                self._sequence += 1
+                self._latest = (frame, self._sequence, slot, templates)
+                self.stats["captured"] += 1
+                self._cond.notify_all()
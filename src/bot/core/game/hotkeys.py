@@ -1,7 +1,8 @@
-import keyboard
-import multiprocessing
 from ...utils.logger import log
-from ...utils.roi_visualizer import main as show_roi_visualizer
+
+# keyboard is imported when hotkeys are registered, and multiprocessing and
+# the Qt visualizer only when the visualizer is opened, so importing this
+# module stays cheap.
 
 class Hotkeys:
     def __init__(self, bot):
@@ -13,6 +14,8 @@ class Hotkeys:
         self._register_hotkeys()
 
     def _register_hotkeys(self):
+        import keyboard
+
         # Clear any existing hotkeys first
         self.unregister_all()
         
@@ -41,6 +44,11 @@ class Hotkeys:
 
     def unregister_all(self):
         """Unregister all hotkeys"""
+        if not self._registered_keys:
+            return
+
+        import keyboard
+
         for key in self._registered_keys:
             try:
                 keyboard.remove_hotkey(key)
@@ -55,12 +63,17 @@ class Hotkeys:
             self.visualizer_process = None
         else:
             log("[HOTKEY] Opening the ROI visualizer.")
+            import multiprocessing
+            from ...utils.roi_visualizer import main as show_roi_visualizer
+
             # Runs the visualizer in a separate process so it doesn’t block the main UI
             self.visualizer_process = multiprocessing.Process(target=show_roi_visualizer, daemon=True)
             self.visualizer_process.start()
 
     def wait_for_exit(self):
         """Keeps the script running until the exit hotkey is pressed."""
+        import keyboard
+
         keyboard.wait('8')
 
     def cleanup(self):
@@ -0,0 +1,193 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from ...utils.logger import log
+from .detector import Detector
+from .frame import Frame
+
+SESSION_FILE = "session.json"
+SESSION_VERSION = 1
+
+
+class SessionRecorder:
+    """
+    Records captured frames to a directory so that detection can be replayed
+    without the game.
+
+    Frames are buffered and written as compressed npz chunks on a background
+    thread. Each chunk holds the BGR images (frame_0, frame_1, ...), their
+    capture timestamps in seconds since the first recorded frame, and their
+    origins in screen coordinates, since ROI captures only cover part of the
+    screen. session.json describes the screen size and lists the chunks.
+
+    At most max_pending_chunks full chunks wait for the writer. When it
+    falls further behind (full-screen frames at an uncapped frame rate
+    compress slower than they arrive), new frames are dropped with a
+    warning rather than letting memory grow; timestamps keep the gap.
+    """
+
+    def __init__(self, path, screen_size, chunk_size=100, max_pending_chunks=2):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.screen_size = screen_size
+        self.chunk_size = chunk_size
+
+        self._lock = threading.Lock()
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="SessionRecorder")
+        self._backlog = threading.BoundedSemaphore(max_pending_chunks)
+        self._pending = []
+        self._chunks = []
+        self._start = None
+        self.frame_count = 0
+        self.dropped = 0
+
+    def record(self, frame):
+        """Queue a copy of a Frame; capture buffers are reused, so copy now"""
+        with self._lock:
+            if len(self._pending) >= self.chunk_size and not self._flush(block=False):
+                self.dropped += 1
+                if self.dropped % 100 == 1:
+                    log(f"[WARNING] Recorder can't keep up, dropped {self.dropped} frames so far")
+                return
+
+            if self._start is None:
+                self._start = frame.timestamp
+            self._pending.append((frame.bgr.copy(), frame.timestamp - self._start, frame.origin))
+            self.frame_count += 1
+            if len(self._pending) >= self.chunk_size:
+                self._flush(block=False)
+
+    def _flush(self, block=True):
+        """Hand the pending frames to the writer; False if its backlog is full"""
+        if not self._pending:
+            return True
+        if not self._backlog.acquire(blocking=block):
+            return False
+        name = f"chunk_{len(self._chunks):05d}.npz"
+        self._chunks.append(name)
+        frames, self._pending = self._pending, []
+        self._writer.submit(self._write_chunk, self.path / name, frames, self._backlog)
+        return True
+
+    @staticmethod
+    def _write_chunk(path, frames, backlog):
+        try:
+            arrays = {f"frame_{i}": bgr for i, (bgr, _, _) in enumerate(frames)}
+            arrays["timestamps"] = np.array([t for _, t, _ in frames], dtype=np.float64)
+            arrays["origins"] = np.array([o for _, _, o in frames], dtype=np.int32).reshape(-1, 2)
+            np.savez_compressed(path, **arrays)
+        finally:
+            backlog.release()
+
+    def close(self):
+        """Write the remaining frames and the session description"""
+        with self._lock:
+            self._flush()
+        self._writer.shutdown(wait=True)
+
+        width, height = self.screen_size
+        session = {
+            "version": SESSION_VERSION,
+            "width": width,
+            "height": height,
+            "frames": self.frame_count,
+            "dropped": self.dropped,
+            "chunks": self._chunks,
+        }
+        with open(self.path / SESSION_FILE, "w") as f:
+            json.dump(session, f, indent=2)
+        log(f"[INFO] 💾 Recorded {self.frame_count} frames to '{self.path}'")
+
+
+def load_session(path):
+    """Read session.json of a recording"""
+    with open(Path(path) / SESSION_FILE) as f:
+        session = json.load(f)
+    if session.get("version") != SESSION_VERSION:
+        raise ValueError(f"Unsupported recording version: {session.get('version')}")
+    return session
+
+
+def iter_recording(path):
+    """Yield (bgr, timestamp, origin) for every frame of a recording, in order"""
+    path = Path(path)
+    for name in load_session(path)["chunks"]:
+        with np.load(path / name) as chunk:
+            timestamps = chunk["timestamps"]
+            origins = chunk["origins"]
+            for i, timestamp in enumerate(timestamps):
+                yield chunk[f"frame_{i}"], float(timestamp), tuple(int(v) for v in origins[i])
+
+
+class ReplayDetector(Detector):
+    """
+    Detector whose capture_screen plays back a recording instead of grabbing
+    the screen.
+
+    speed 1.0 replays at the recorded pace, other values scale it, and 0
+    replays as fast as frames are requested. Frame timestamps follow the
+    recorded timeline, so the change gate behaves as it did when recording.
+    Once the recording is exhausted capture_screen returns None, unless loop
+    is set.
+
+    The templates passed to capture_screen are ignored: every frame is
+    returned as it was captured.
+    """
+
+    def __init__(self, config, path, speed=1.0, loop=False):
+        self.path = Path(path)
+        self.session = load_session(self.path)
+        self.speed = speed
+        self.loop = loop
+
+        # Lay out ROIs for the screen the session was recorded on
+        screen = config.bot.screen
+        screen.follow_window = False
+        screen.monitor_x = 0
+        screen.monitor_y = 0
+        screen.monitor_width = self.session["width"]
+        screen.monitor_height = self.session["height"]
+
+        super().__init__(config)
+        self._frames = iter_recording(self.path)
+        self._clock_start = None
+        self._time_offset = 0.0
+        self._last_timestamp = 0.0
+        self.frames_played = 0
+        log(f"[INFO] ▶️ Replaying {self.session['frames']} frames from '{self.path}'")
+
+    @property
+    def finished(self):
+        return self._frames is None
+
+    def capture_screen(self, templates=None, gray_buffers=None):
+        if self._frames is None:
+            return None
+
+        recorded = next(self._frames, None)
+        if recorded is None and self.loop and self.frames_played:
+            self._time_offset = self._last_timestamp
+            self._frames = iter_recording(self.path)
+            recorded = next(self._frames, None)
+        if recorded is None:
+            self._frames = None
+            return None
+
+        bgr, timestamp, origin = recorded
+        timestamp += self._time_offset
+        if self._clock_start is None:
+            self._clock_start = time.perf_counter() - timestamp / self.speed if self.speed > 0 else 0.0
+
+        if self.speed > 0:
+            wait = self._clock_start + timestamp / self.speed - time.perf_counter()
+            if wait > 0:
+                time.sleep(wait)
+
+        self._last_timestamp = timestamp
+        self.frames_played += 1
+        return Frame(bgr, timestamp=timestamp, origin=origin)
@@ -0,0 +1,56 @@
+class ResolutionScaler:
+    """
+    Maps coordinates authored for the base resolution (1080p) onto the
+    detected client size.
+
+    Positions scale independently along each axis so that ROIs and click
+    points keep their relative place on screen. Templates scale uniformly by
+    the smaller of the two factors, which keeps their aspect ratio on
+    ultrawide and 16:10 clients.
+    """
+
+    def __init__(self, base_resolution, width, height):
+        base_width, base_height = base_resolution
+        self.width = width
+        self.height = height
+        self.scale_x = width / base_width
+        self.scale_y = height / base_height
+        self.template_scale = min(self.scale_x, self.scale_y)
+
+        # Rounding positions and template sizes independently can leave a
+        # scaled template a pixel or two outside its scaled ROI
+        self.slack = 0 if self.is_identity else 2
+
+    @property
+    def is_identity(self):
+        return self.scale_x == 1 and self.scale_y == 1
+
+    def scale_point(self, point):
+        x, y = point
+        return round(x * self.scale_x), round(y * self.scale_y)
+
+    def scale_rect(self, rect, min_size=None):
+        """Scale an (x, y, w, h) rectangle, growing it to fit min_size (w, h)"""
+        x, y, w, h = rect
+        w = round(w * self.scale_x)
+        h = round(h * self.scale_y)
+        if min_size is not None:
+            w = max(w, min_size[0])
+            h = max(h, min_size[1])
+        x = max(0, round(x * self.scale_x) - self.slack)
+        y = max(0, round(y * self.scale_y) - self.slack)
+        return x, y, w + 2 * self.slack, h + 2 * self.slack
+
+    def scale_rois(self, rois, template_sizes=None):
+        """
+        Scale a ROI table. Aliases (string values) and empty ROIs are kept
+        as they are. template_sizes maps names to scaled (w, h) so that every
+        ROI stays large enough to contain its template.
+        """
+        template_sizes = template_sizes or {}
+        scaled = {}
+        for name, roi in rois.items():
+            if roi and not isinstance(roi, str):
+                roi = self.scale_rect(roi, template_sizes.get(name))
+            scaled[name] = roi
+        return scaled
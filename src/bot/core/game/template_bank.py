@@ -0,0 +1,365 @@
+import hashlib
+import json
+import struct
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+
+import cv2 as cv
+import numpy as np
+
+from ...utils.logger import log
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# Bump when the cached arrays change meaning
+CACHE_VERSION = 1
+
+# Compiled templates shared by every detector in the process
+_compiled = {}
+_compiled_lock = threading.Lock()
+
+# Normalized match methods selectable per template. Scores are always
+# reported as "higher is better", so squared differences are flipped.
+MATCH_METHODS = {
+    "ccoeff_normed": cv.TM_CCOEFF_NORMED,
+    "ccorr_normed": cv.TM_CCORR_NORMED,
+    "sqdiff_normed": cv.TM_SQDIFF_NORMED,
+}
+
+
+class CompiledTemplate:
+    """Template image prepared once at load time for the match path"""
+
+    # Coarse levels smaller than this are too blurry to find candidates with
+    MIN_PYRAMID_SIZE = 8
+    # Downscaling blends the background into the edges of a mask, so thin
+    # masked templates (the rod icons) score well below the coarse
+    # threshold at their true position; those are searched directly
+    MIN_MASKED_PYRAMID_SIZE = 24
+
+    # Intensity histogram used by the prefilter; a bin holding at least
+    # DOMINANT_SHARE of the template's pixels is one the search area must have
+    PREFILTER_BINS = 32
+    DOMINANT_SHARE = 0.1
+
+    def __init__(self, name, image, mask=None, method=None, pyramid_scale=None, settings=None):
+        settings = settings or {}
+        self.name = name
+        self.gray = cv.cvtColor(image, cv.COLOR_BGR2GRAY) if image.ndim == 3 else image
+        self.height, self.width = self.gray.shape[:2]
+
+        if method is None:
+            method_name = settings.get("method", "ccoeff_normed")
+            if method_name not in MATCH_METHODS:
+                raise ValueError(f"Template '{name}' has unknown match method '{method_name}'")
+            method = MATCH_METHODS[method_name]
+        self.method = method
+
+        # Detection settings, resolved against the global defaults by the
+        # detector; None means the caller's default applies
+        self.threshold = settings.get("threshold")
+        self.radius_search_mode = settings.get("radius_search_mode")
+        self.full_frame_search = settings.get("full_frame_search")
+        self.track_last_hit = bool(settings.get("track_last_hit", False))
+
+        # A fully opaque alpha channel masks nothing, and unmasked matching
+        # is considerably cheaper in OpenCV, so drop it up front. use_mask
+        # False drops any mask, trading accuracy on busy backgrounds for speed.
+        self.opaque_mask = mask is not None and bool(np.all(mask == 255))
+        use_mask = settings.get("use_mask", True)
+        self.mask = None if mask is None or self.opaque_mask or not use_mask else mask
+
+        self.prefilter = bool(settings.get("prefilter", False))
+        hist_mask = None if self.mask is None else (self.mask > 127).astype(np.uint8)
+        self.histogram = cv.calcHist([self.gray], [0], hist_mask, [self.PREFILTER_BINS], [0, 256]).ravel()
+        total = self.histogram.sum()
+        self.dominant_bins = [
+            b for b, count in enumerate(self.histogram)
+            if count >= self.DOMINANT_SHARE * total
+        ]
+
+        # Color-threshold strategy: an HSV range plus the pixel count of the
+        # largest connected blob in that range, measured on the template
+        self.strategy = settings.get("strategy", "template")
+        self.color_confirm = bool(settings.get("confirm", True))
+        self.color_lower = self.color_upper = None
+        self.min_component_pixels = 0
+        if self.strategy == "color_threshold":
+            if image.ndim != 3:
+                raise ValueError(f"Template '{name}' needs a color image for the color_threshold strategy")
+            self.color_lower = np.array(settings["hsv_lower"], dtype=np.uint8)
+            self.color_upper = np.array(settings["hsv_upper"], dtype=np.uint8)
+            area, _ = self.largest_color_component(image, mask)
+            self.min_component_pixels = max(1, int(area * settings.get("min_component_ratio", 0.5)))
+
+        # Downscaled copy used for the coarse pass of full-screen searches
+        self.pyramid_scale = None
+        self.coarse = None
+        if pyramid_scale and 0 < pyramid_scale < 1:
+            size = (round(self.width * pyramid_scale), round(self.height * pyramid_scale))
+            min_size = self.MIN_PYRAMID_SIZE if self.mask is None else self.MIN_MASKED_PYRAMID_SIZE
+            if min(size) >= min_size:
+                coarse_mask = None if self.mask is None else cv.resize(self.mask, size, interpolation=cv.INTER_AREA)
+                self.pyramid_scale = pyramid_scale
+                self.coarse = CompiledTemplate(
+                    name, cv.resize(self.gray, size, interpolation=cv.INTER_AREA), coarse_mask, method
+                )
+
+    @property
+    def shape(self):
+        return self.height, self.width
+
+    def match(self, search_gray):
+        """
+        Run matchTemplate against a grayscale search area; higher scores are
+        better. Flat areas (a black loading screen) score nan, or inf with a
+        mask; those come back as -1 so no caller can mistake them for a hit.
+        """
+        result = cv.matchTemplate(search_gray, self.gray, self.method, mask=self.mask)
+        if self.method == cv.TM_SQDIFF_NORMED:
+            np.subtract(1.0, result, out=result)
+        np.nan_to_num(result, copy=False, nan=-1.0, posinf=-1.0, neginf=-1.0)
+        return result
+
+    def largest_color_component(self, bgr, mask=None):
+        """
+        Area and centroid (x, y) of the largest 8-connected blob of pixels
+        inside the template's HSV range. Returns (0, None) if there is none.
+        """
+        in_range = cv.inRange(cv.cvtColor(bgr, cv.COLOR_BGR2HSV), self.color_lower, self.color_upper)
+        if mask is not None:
+            in_range[mask <= 127] = 0
+
+        count, _, stats, centroids = cv.connectedComponentsWithStats(in_range, connectivity=8)
+        if count < 2:
+            return 0, None
+
+        largest = 1 + int(np.argmax(stats[1:, cv.CC_STAT_AREA]))
+        return int(stats[largest, cv.CC_STAT_AREA]), tuple(centroids[largest])
+
+    def passes_prefilter(self, search_gray, min_ratio, tolerance):
+        """
+        Cheap intensity check run before matching. The search area must hold
+        at least min_ratio of the template's pixel count in each of the
+        template's dominant intensity bins, give or take tolerance bins so
+        that brightness shifts don't reject a real match. If it doesn't, the
+        template can't be there.
+        """
+        hist = cv.calcHist([search_gray], [0], None, [self.PREFILTER_BINS], [0, 256]).ravel()
+        for b in self.dominant_bins:
+            if hist[max(0, b - tolerance):b + tolerance + 1].sum() < min_ratio * self.histogram[b]:
+                return False
+        return True
+
+
+def template_size(path, scale=1.0):
+    """
+    (width, height) a template will have once compiled, read from the PNG
+    header so that nothing has to be decoded. Returns None if unreadable.
+    """
+    try:
+        with open(path, "rb") as f:
+            header = f.read(24)
+    except OSError:
+        return None
+
+    if header[:8] == PNG_SIGNATURE and header[12:16] == b"IHDR":
+        width, height = struct.unpack(">II", header[16:24])
+    else:
+        img = cv.imread(str(path), cv.IMREAD_UNCHANGED)
+        if img is None:
+            return None
+        height, width = img.shape[:2]
+
+    if scale != 1.0:
+        return max(1, round(width * scale)), max(1, round(height * scale))
+    return width, height
+
+
+def _keeps_color(settings):
+    """Only the color-threshold strategy looks at color"""
+    return (settings or {}).get("strategy") == "color_threshold"
+
+
+def _cache_keys(data, scale, settings):
+    """
+    (asset, variant) naming a cache entry: a hash of the PNG bytes, and one
+    of the parameters that shape the decoded arrays. Match settings such as
+    the threshold do not change the arrays, so they are not part of either.
+    """
+    asset = hashlib.sha1(f"{CACHE_VERSION}:".encode() + data).hexdigest()[:16]
+    variant = hashlib.sha1(json.dumps([scale, _keeps_color(settings)]).encode()).hexdigest()[:8]
+    return asset, variant
+
+
+def _read_cache(cache_dir, name, asset, variant):
+    path = Path(cache_dir) / f"{name}-{asset}-{variant}.npz"
+    try:
+        with np.load(path) as cached:
+            return cached["image"], cached["mask"] if "mask" in cached else None
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _write_cache(cache_dir, name, asset, variant, image, mask):
+    """Store one entry, dropping the template's entries for older PNGs; other scales stay"""
+    cache_dir = Path(cache_dir)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        for entry in cache_dir.glob(f"{name}-*.npz"):
+            # {name}-{asset}-{variant}, or {name}-{key} from before entries had variants
+            parts = entry.stem.rsplit("-", 2)
+            if parts[0] == name and parts[1] != asset:
+                entry.unlink()
+        arrays = {"image": image} if mask is None else {"image": image, "mask": mask}
+        np.savez(cache_dir / f"{name}-{asset}-{variant}.npz", **arrays)
+    except OSError as e:
+        log(f"[INFO] ⚠️ Could not cache template '{name}': {e}")
+
+
+def _decode(name, data, scale, settings):
+    """Decode and scale a PNG into (image, mask); image is gray unless color is needed"""
+    img = cv.imdecode(np.frombuffer(data, dtype=np.uint8), cv.IMREAD_UNCHANGED)
+    if img is None:
+        return None
+
+    if scale != 1.0:
+        size = (max(1, round(img.shape[1] * scale)), max(1, round(img.shape[0] * scale)))
+        interpolation = cv.INTER_AREA if scale < 1.0 else cv.INTER_LINEAR
+        img = cv.resize(img, size, interpolation=interpolation)
+
+    mask = None
+    if img.ndim == 3 and img.shape[2] == 4:
+        mask = np.ascontiguousarray(img[:, :, 3])
+        img = cv.cvtColor(img, cv.COLOR_BGRA2BGR)
+
+    if img.ndim == 3 and not _keeps_color(settings):
+        img = cv.cvtColor(img, cv.COLOR_BGR2GRAY)
+    return img, mask
+
+
+def compile_template(name, path, pyramid_scale=None, scale=1.0, settings=None, cache_dir=None):
+    """
+    Read a template PNG from disk and compile it, or return None.
+    scale resizes the template (and its mask) for non-1080p clients, and
+    settings holds the template's entry from DetectionConfig.template_settings.
+
+    With a cache_dir, the decoded and scaled arrays are kept there as npz,
+    one file per PNG hash, scale and color/gray choice, so a changed asset
+    is decoded again and replaces its old entries. Compiled templates are
+    also shared within the process, so rebuilding a detector (e.g. when
+    switching bots) costs nothing.
+    """
+    try:
+        data = Path(path).read_bytes()
+    except OSError as e:
+        log(f"[INFO] ❌ {name} - could not be read at '{path}': {e}")
+        return None
+
+    asset, variant = _cache_keys(data, scale, settings)
+    key = (name, asset, variant, pyramid_scale, json.dumps(settings, sort_keys=True, default=str))
+    with _compiled_lock:
+        template = _compiled.get(key)
+    if template is not None:
+        return template
+
+    decoded = _read_cache(cache_dir, name, asset, variant) if cache_dir else None
+    source = "cache"
+    if decoded is None:
+        decoded = _decode(name, data, scale, settings)
+        if decoded is None:
+            log(f"[INFO] ❌ {name} - could not be decoded at '{path}'")
+            return None
+        if cache_dir:
+            _write_cache(cache_dir, name, asset, variant, *decoded)
+        source = "png"
+
+    image, mask = decoded
+    template = CompiledTemplate(name, image, mask, pyramid_scale=pyramid_scale, settings=settings)
+    if mask is None:
+        log(f"[INFO] ✅ {name} ({source})")
+    elif template.opaque_mask:
+        log(f"[INFO] ✅ {name} ({source}, opaque mask dropped)")
+    elif template.mask is None:
+        log(f"[INFO] ✅ {name} ({source}, mask disabled)")
+    else:
+        log(f"[INFO] ✅ {name} ({source}, with transparency mask)")
+
+    with _compiled_lock:
+        _compiled[key] = template
+    return template
+
+
+class TemplateBank(Mapping):
+    """
+    Compiled templates by name, each compiled the first time it is asked
+    for. Bots that never look at a template never pay for loading it.
+
+    sources maps names to PNG paths; settings maps names to their resolved
+    template settings. Lookups are safe from several threads.
+    """
+
+    def __init__(self, sources, pyramid_scale=None, scale=1.0, settings=None, cache_dir=None):
+        self.sources = sources
+        self.pyramid_scale = pyramid_scale
+        self.scale = scale
+        self.settings = settings or {}
+        self.cache_dir = cache_dir
+
+        self._templates = {}
+        self._missing = set()
+        self._lock = threading.Lock()
+
+    def get(self, name, default=None):
+        template = self._templates.get(name)
+        if template is not None:
+            return template
+        if name not in self.sources or name in self._missing:
+            return default
+
+        with self._lock:
+            if name not in self._templates and name not in self._missing:
+                template = self._load(name)
+                if template is None:
+                    self._missing.add(name)
+                else:
+                    self._templates[name] = template
+        return self._templates.get(name, default)
+
+    def _load(self, name):
+        path = self.sources[name]
+        if not (path and Path(path).exists()):
+            log(f"[INFO] ❌ {name} - not found at '{path}'")
+            return None
+        return compile_template(
+            name, path, self.pyramid_scale, self.scale, self.settings.get(name), self.cache_dir
+        )
+
+    def __getitem__(self, name):
+        template = self.get(name)
+        if template is None:
+            raise KeyError(name)
+        return template
+
+    def __contains__(self, name):
+        return self.get(name) is not None
+
+    def __iter__(self):
+        """Every template that can be loaded; iterating loads them all"""
+        return (name for name in list(self.sources) if name in self)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def size(self, name):
+        """(width, height) of a template without compiling it"""
+        template = self._templates.get(name)
+        if template is not None:
+            return template.width, template.height
+        path = self.sources.get(name)
+        return template_size(path, self.scale) if path else None
+
+    def loaded(self):
+        """Names compiled so far"""
+        return list(self._templates)
@@ -13,4 +13,8 @@ class BotState(BotComponent, ABC):
 
     @abstractmethod
     def handle(self, screen):
-        pass
\ No newline at end of file
+        pass
+
+    def get_poll_rate(self):
+        """Frames per second to poll at in this state; 0 is as fast as possible"""
+        return 10.0
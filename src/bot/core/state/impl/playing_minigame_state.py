@@ -64,4 +64,7 @@ class PlayingMinigameState(BotState):
         self._handle_arrow('left', screen)
         self._handle_arrow('right', screen)
 
-        return StateType.PLAYING_MINIGAME
\ No newline at end of file
+        return StateType.PLAYING_MINIGAME
+
+    def get_poll_rate(self):
+        return 0  # arrow switches need the newest frame
@@ -15,8 +15,7 @@ class StartingState(BotState):
         # self._count = self._count + 1
 
         if self.detector.find(screen, "connect_server", 5, debug=self.bot.debug_mode):
-            x = 1100 + self.window.monitor_x
-            y = 795 + self.window.monitor_y
+            x, y = self.detector.click_point("connect_server")
 
             self.controller.move_to(x, y)
             time.sleep(0.5)
@@ -67,3 +66,6 @@ class StartingState(BotState):
             self._last_search_log = current_time
 
         return StateType.STARTING
+
+    def get_poll_rate(self):
+        return 4.0  # menus and loading screens change slowly
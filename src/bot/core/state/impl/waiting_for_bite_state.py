@@ -24,4 +24,7 @@ class WaitingForBiteState(BotState):
                 self.bot.log("[WAITING_FOR_BITE] ⏳ Waiting for fish...")
                 self._last_wait_log = current_time
 
-            return StateType.WAITING_FOR_BITE
\ No newline at end of file
+            return StateType.WAITING_FOR_BITE
+
+    def get_poll_rate(self):
+        return 0  # every frame counts when the fish bites
@@ -1,8 +1,8 @@
-import time
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from .state_type import StateType
 from .base_interceptor import BaseInterceptor
+from ..shared.frame_scheduler import FrameScheduler
 from ..utils.logger import log
 
 
@@ -18,15 +18,17 @@ class BaseBot(ABC):
         self.detector = None
         self.controller = None
         self.state_machine = None
+        self.frame_producer = None
+        self.recorder = None
 
         # Interceptors
         self.interceptors: List[BaseInterceptor] = []
 
-        # Performance settings
-        self.target_delay = 0
+        # Performance settings: target_fps caps the poll rate of every state
+        max_fps = 0
         if hasattr(config, "bot") and hasattr(config.bot, "target_fps"):
-            if config.bot.target_fps > 0:
-                self.target_delay = 1.0 / config.bot.target_fps
+            max_fps = config.bot.target_fps
+        self.scheduler = FrameScheduler(max_fps)
 
         # Initialize bot-specific components
         self._initialize_components()
@@ -56,6 +58,8 @@ class BaseBot(ABC):
         """Start the bot"""
         self.log(f"[INFO] 🤖 {self.get_bot_type()} bot ready!")
         self._on_start()
+        self._start_frame_producer()
+        self._start_recorder()
         self._start_main_state()
 
     def update(self) -> None:
@@ -63,32 +67,95 @@ class BaseBot(ABC):
         if self._stopped:
             return
 
-        loop_start = time.time()
-        screen = self.detector.capture_screen()
-
-        # Check interceptors first
-        for interceptor in sorted(
-            self.interceptors, key=lambda x: x.priority, reverse=True
-        ):
-            result = interceptor.intercept(screen)
-            if result is not None:
-                # Interceptor handled the event, continue to next frame
-                break
-        else:
-            # No interceptor handled the event, process normally
-            self.state_machine.handle(screen)
+        self.scheduler.begin()
+        screen = self._next_frame()
+        if screen is not None:
+            # Check interceptors first
+            for interceptor in sorted(
+                self.interceptors, key=lambda x: x.priority, reverse=True
+            ):
+                result = interceptor.intercept(screen)
+                if result is not None:
+                    # Interceptor handled the event, continue to next frame
+                    break
+            else:
+                # No interceptor handled the event, process normally
+                self.state_machine.handle(screen)
+
+        # Paced by the state we end up in, so a state switched to this
+        # frame gets its own rate right away
+        state = self.state_machine.current_state
+        rate = state.get_poll_rate() if state is not None else None
+        self.scheduler.pace(self.state_machine.current_state_name, rate)
+
+    def _start_frame_producer(self) -> None:
+        """Start the background capture thread if the config enables it"""
+        if not getattr(self.config, "threaded_capture", False) or self.detector is None:
+            return
+
+        from ..core.game.frame_producer import FrameProducer
 
-        if self.target_delay > 0:
-            loop_time = time.time() - loop_start
-            sleep_time = max(0, self.target_delay - loop_time)
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+        self.frame_producer = FrameProducer(
+            self.detector, max_fps=getattr(self.config, "capture_fps", 0)
+        )
+        self.frame_producer.start()
+
+    def _start_recorder(self) -> None:
+        """Record captured frames if the config sets a record path"""
+        record_path = getattr(self.config, "record_path", "")
+        if not record_path or self.detector is None:
+            return
+
+        from ..core.game.recorder import SessionRecorder
+
+        monitor = self.detector.monitor
+        self.recorder = SessionRecorder(record_path, (monitor["width"], monitor["height"]))
+        self.log(f"[INFO] ⏺️ Recording frames to '{record_path}'")
+
+    def _next_frame(self) -> Any:
+        """Newest frame from the capture thread, or a direct capture"""
+        templates = self._get_required_templates()
+        if self.frame_producer is not None:
+            frame = self.frame_producer.get_frame(templates)
+        else:
+            frame = self.detector.capture_screen(templates)
+        if frame is not None and self.recorder is not None:
+            self.recorder.record(frame)
+        return frame
+
+    def _get_required_templates(self) -> Optional[List[str]]:
+        """Templates needed this frame by the current state and interceptors"""
+        state = self.state_machine.current_state
+        if state is None:
+            return None
+
+        templates = state.get_required_templates()
+        if not templates:
+            return None
+        templates = list(templates)
+
+        for interceptor in self.interceptors:
+            if not interceptor.enabled:
+                continue
+            interceptor_templates = interceptor.get_required_templates()
+            if not interceptor_templates:
+                return None
+            templates.extend(interceptor_templates)
+
+        return templates
 
     def stop(self) -> None:
         """Stop the bot"""
         if not self._stopped:
             self.log(f"[BOT] 🛑 Shutting down {self.get_bot_type()} bot...")
             self._stopped = True
+            if self.frame_producer is not None:
+                self.frame_producer.stop()
+            if self.recorder is not None:
+                self.recorder.close()
+            if self.detector is not None:
+                self.detector.close()
+            self.scheduler.log_summary()
             self._on_stop()
 
             try:
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, List, Optional
 
 
 class BaseInterceptor(ABC):
@@ -36,6 +36,14 @@ class BaseInterceptor(ABC):
         """
         pass
 
+    def get_required_templates(self) -> Optional[List[str]]:
+        """
+        Return the templates this interceptor looks for (optional override)
+
+        None means the interceptor needs the full screen.
+        """
+        return None
+
     def intercept(self, screen: Any) -> Optional[Any]:
         """Main interception method"""
         if not self.enabled:
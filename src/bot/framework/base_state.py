@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, List, Optional
 from .state_type import StateType
 
 
@@ -41,3 +41,21 @@ class BaseState(ABC):
     def get_timeout_limit(self) -> float:
         """Return timeout limit for this state (optional override)"""
         return None
+
+    def get_poll_rate(self) -> Optional[float]:
+        """
+        Frames per second to poll at while in this state (optional override)
+
+        0 or None polls as fast as possible; the bot's target_fps still caps
+        it. States that only wait for slow screens poll less to save CPU.
+        """
+        return 10.0
+
+    def get_required_templates(self) -> Optional[List[str]]:
+        """
+        Return the templates this state looks for (optional override)
+
+        The detector captures only the union of their ROIs. None means the
+        state needs the full screen.
+        """
+        return None
@@ -1,4 +1,4 @@
-from typing import Dict, Type, Any, List
+from typing import Dict, Type, Any, List, Callable, Optional
 from .base_bot import BaseBot
 from ..utils.logger import log
 
@@ -8,17 +8,31 @@ class BotFactory:
 
     _bot_types: Dict[str, Type[BaseBot]] = {}
     _bot_configs: Dict[str, Dict[str, Any]] = {}
+    _bot_descriptions: Dict[str, str] = {}
+    _bot_config_classes: Dict[str, Callable[[], Any]] = {}
 
     @classmethod
-    def register_bot(cls, bot_type: str, bot_class: Type[BaseBot]) -> None:
+    def register_bot(
+        cls,
+        bot_type: str,
+        bot_class: Type[BaseBot],
+        description: Optional[str] = None,
+        config_class: Optional[Callable[[], Any]] = None,
+    ) -> None:
         """
         Register a new bot type
 
         Args:
             bot_type: String identifier for the bot
             bot_class: Class that inherits from BaseBot
+            description: Optional description shown in menus
+            config_class: Optional factory for the bot's default config
         """
         cls._bot_types[bot_type] = bot_class
+        if description:
+            cls._bot_descriptions[bot_type] = description
+        if config_class is not None:
+            cls._bot_config_classes[bot_type] = config_class
         log(f"[FACTORY] ✅ Registered bot type: {bot_type}")
 
     @classmethod
@@ -58,11 +72,19 @@ class BotFactory:
     @classmethod
     def _create_default_config(cls, bot_type: str) -> Any:
         """Create default configuration for a bot type"""
-        if bot_type in cls._bot_types:
-            # Create temporary bot instance to get default config
-            temp_bot = cls._bot_types[bot_type](None)
-            return temp_bot.get_default_config()
-        return {}
+        return cls.create_default_config(bot_type)
+
+    @classmethod
+    def create_default_config(cls, bot_type: str) -> Any:
+        """
+        Build the default config object of a bot type from its registered
+        config class, without constructing the bot. Returns None when the
+        bot type registered no config class.
+        """
+        config_class = cls._bot_config_classes.get(bot_type)
+        if config_class is None:
+            return None
+        return config_class()
 
     @classmethod
     def register_default_config(cls, bot_type: str, config: Dict[str, Any]) -> None:
@@ -73,13 +95,9 @@ class BotFactory:
     def get_bot_descriptions(cls) -> Dict[str, str]:
         """Get descriptions for all registered bot types"""
         descriptions = {}
-        for bot_type in cls._bot_types:
-            # Create temporary instance to get description
-            try:
-                temp_bot = cls._bot_types[bot_type](None)
-                descriptions[bot_type] = getattr(
-                    temp_bot, "get_description", lambda: f"{bot_type} bot"
-                )()
-            except:
-                descriptions[bot_type] = f"{bot_type} bot"
+        for bot_type, bot_class in cls._bot_types.items():
+            description = cls._bot_descriptions.get(bot_type)
+            if description is None and hasattr(bot_class, "get_description"):
+                description = bot_class.get_description()
+            descriptions[bot_type] = description or f"{bot_type} bot"
         return descriptions
@@ -1,26 +1,34 @@
-from typing import Type, Callable, Any
+from typing import Type, Any
 from .base_bot import BaseBot
 from .bot_factory import BotFactory
 from ..config.config_registry import ConfigRegistry
 
 
-def register_bot(bot_type: str, description: str = None):
+def register_bot(bot_type: str, description: str = None, config_class: Type[Any] = None):
     """
     Decorator to register a bot type
 
+    The description and config class are stored as metadata, so the menu
+    and factory never need to construct a bot to read them.
+
     Args:
         bot_type: String identifier for the bot
         description: Optional description of the bot
+        config_class: Optional config class; called with no arguments to
+            build the bot's default configuration
     """
 
     def decorator(bot_class: Type[BaseBot]) -> Type[BaseBot]:
         # Register the bot with the factory
-        BotFactory.register_bot(bot_type, bot_class)
+        BotFactory.register_bot(bot_type, bot_class, description, config_class)
 
         # Add description if provided
         if description:
             bot_class.get_description = classmethod(lambda cls: description)
 
+        if config_class is not None:
+            ConfigRegistry.register_config(bot_type, config_class)
+
         return bot_class
 
     return decorator
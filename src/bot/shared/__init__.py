@@ -1,4 +1,5 @@
+from .frame_scheduler import FrameScheduler
 from .state_machine import StateMachine
 from .stats_tracker import StatsTracker
 
-__all__ = ["StateMachine", "StatsTracker"]
+__all__ = ["FrameScheduler", "StateMachine", "StatsTracker"]
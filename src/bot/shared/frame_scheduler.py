@@ -0,0 +1,93 @@
+import time
+from typing import Any, Dict, Optional
+
+from ..utils.logger import log
+
+
+class FrameScheduler:
+    """
+    Paces the bot loop at the poll rate of the current state.
+
+    Call begin() when a loop iteration starts and pace() when it ends;
+    pace() sleeps until one interval after begin(), measured with
+    time.perf_counter, so the time spent capturing and matching is part of
+    the interval and time spent outside the loop (paused) is not. A rate of
+    0 (or None) polls as fast as possible. max_fps, when set, caps every
+    rate.
+
+    Per key (normally the state name) it records the frames, the busy time
+    before pace() was called, the overruns (frames whose work alone took
+    longer than the interval) and the jitter, which is how late the sleep
+    woke up past the deadline.
+    """
+
+    def __init__(self, max_fps: float = 0):
+        self.min_interval = 1.0 / max_fps if max_fps > 0 else 0.0
+        self._frame_start: Optional[float] = None
+        self.stats: Dict[Any, Dict[str, float]] = {}
+
+    def interval(self, rate: Optional[float]) -> float:
+        """Seconds between frames for a poll rate, after the max_fps cap"""
+        interval = 1.0 / rate if rate else 0.0
+        return max(interval, self.min_interval)
+
+    def begin(self) -> None:
+        self._frame_start = time.perf_counter()
+
+    def pace(self, key: Any = None, rate: Optional[float] = None) -> None:
+        """Wait until the next frame of the given poll rate is due"""
+        if self._frame_start is None:
+            return
+        now = time.perf_counter()
+        start, self._frame_start = self._frame_start, None
+
+        entry = self.stats.get(key)
+        if entry is None:
+            entry = self.stats[key] = {
+                "frames": 0, "busy": 0.0, "elapsed": 0.0,
+                "overruns": 0, "slept": 0, "jitter": 0.0, "max_jitter": 0.0,
+            }
+
+        interval = self.interval(rate)
+        deadline = start + interval
+        woke = now
+        if now < deadline:
+            time.sleep(deadline - now)
+            woke = time.perf_counter()
+            jitter = woke - deadline
+            entry["slept"] += 1
+            entry["jitter"] += jitter
+            entry["max_jitter"] = max(entry["max_jitter"], jitter)
+        elif interval > 0:
+            entry["overruns"] += 1
+
+        entry["frames"] += 1
+        entry["busy"] += now - start
+        entry["elapsed"] += woke - start
+
+    def summary(self) -> Dict[Any, Dict[str, float]]:
+        """Per-key frame rate, busy time, overrun share and jitter"""
+        summary = {}
+        for key, entry in self.stats.items():
+            frames = entry["frames"]
+            if not frames:
+                continue
+            slept = entry["slept"]
+            summary[key] = {
+                "frames": frames,
+                "fps": frames / entry["elapsed"] if entry["elapsed"] > 0 else 0.0,
+                "busy_ms": entry["busy"] / frames * 1000,
+                "overruns": entry["overruns"] / frames,
+                "jitter_ms": entry["jitter"] / slept * 1000 if slept else 0.0,
+                "max_jitter_ms": entry["max_jitter"] * 1000,
+            }
+        return summary
+
+    def log_summary(self) -> None:
+        for key, entry in self.summary().items():
+            name = getattr(key, "name", key)
+            log(
+                f"[INFO] ⏱️ {name}: {entry['fps']:.1f} fps over {entry['frames']} frames, "
+                f"busy {entry['busy_ms']:.1f} ms, overruns {entry['overruns']:.0%}, "
+                f"jitter {entry['jitter_ms']:.2f} ms (max {entry['max_jitter_ms']:.2f})"
+            )
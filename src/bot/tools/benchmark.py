@@ -0,0 +1,252 @@
+"""
+Detector benchmark.
+
+Times capture_screen, _perform_match and find for every configured template,
+at each radius the fishing states search with, on recorded or synthetic
+frames. No game window is needed unless --capture is given. When the frames
+come with ground truth (synthetic frames, or a recording with labels.json),
+detection accuracy is checked as well.
+
+    python -m src.bot.tools.benchmark --output benchmark.json
+    python -m src.bot.tools.benchmark --recording recordings/session1
+"""
+import argparse
+import json
+import platform
+import time
+from pathlib import Path
+
+import cv2 as cv
+import numpy as np
+
+from ..config import Config
+from ..core.game.detector import Detector
+from ..core.game.frame import Frame
+from ..core.game.recorder import iter_recording, load_session
+from ..utils.logger import log
+from .synthetic_frames import SyntheticFrameGenerator, evaluate
+
+# Radii the fishing states pass to find(); every template is also timed at 0
+STATE_RADII = {
+    "connect_server": (5,),
+    "fishing_spot_btn": (1, 5),
+    "level_check": (5,),
+    "flex_rod": (5,),
+    "sturdy_rod": (5,),
+    "reg_rod": (5,),
+    "exclamation": (1,),
+    "success": (1,),
+    "failure": (1,),
+    "continue": (5,),
+}
+
+
+def summarize(samples):
+    """Latency percentiles in milliseconds and calls per second"""
+    samples = np.asarray(samples, dtype=np.float64)
+    total = samples.sum()
+    return {
+        "count": int(samples.size),
+        "p50_ms": float(np.percentile(samples, 50) * 1000),
+        "p95_ms": float(np.percentile(samples, 95) * 1000),
+        "p99_ms": float(np.percentile(samples, 99) * 1000),
+        "mean_ms": float(samples.mean() * 1000),
+        "per_second": float(samples.size / total) if total > 0 else None,
+    }
+
+
+def load_frames(args, detection_config):
+    """(bgr, origin) pairs to time, and their ground truth when known"""
+    if args.recording:
+        frames = []
+        for bgr, _, origin in iter_recording(args.recording):
+            frames.append((bgr, origin))
+            if len(frames) >= args.frames:
+                break
+        labels_path = Path(args.recording) / "labels.json"
+        truths = None
+        if labels_path.exists():
+            with open(labels_path) as f:
+                truths = json.load(f)[:len(frames)]
+        return frames, truths
+
+    generator = SyntheticFrameGenerator(detection_config, seed=args.seed)
+    samples = list(generator.frames(args.frames))
+    return [(bgr, (0, 0)) for bgr, _ in samples], [truth for _, truth in samples]
+
+
+def make_detector(args):
+    config = Config()
+    screen = config.bot.screen
+    if args.recording:
+        session = load_session(args.recording)
+        width, height = session["width"], session["height"]
+    else:
+        width, height = config.bot.detection.base_resolution
+    screen.follow_window = False
+    screen.monitor_x, screen.monitor_y = 0, 0
+    screen.monitor_width, screen.monitor_height = width, height
+
+    detector = Detector(config)
+    if not args.change_gate:
+        detector.change_gate = None
+    return detector
+
+
+def bench_capture(detector, repeat):
+    """Live screen capture, full screen and per-template ROI capture"""
+    report = {}
+    targets = [("full_screen", None)] + [(name, [name]) for name in detector.templates]
+    for label, templates in targets:
+        detector.capture_screen(templates)  # warm up mss and buffers
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            detector.capture_screen(templates)
+            samples.append(time.perf_counter() - start)
+        report[label] = summarize(samples)
+    return report
+
+
+def bench_match(detector, frames, repeat):
+    """Raw matchTemplate + minMaxLoc over each template's padded search area"""
+    report = {}
+    for name, template in detector.templates.items():
+        samples = []
+        for bgr, origin in frames:
+            frame = Frame(bgr, origin=origin)
+            roi = detector._resolve_roi(name)
+            area = (frame.left, frame.top, frame.right - frame.left, frame.bottom - frame.top)
+            if roi:
+                x, y, w, h = roi
+                radius = max(STATE_RADII.get(name, (0,)))
+                area = frame.clamp(x - radius, y - radius, w + 2 * radius, h + 2 * radius)
+                if area[2] <= 0 or area[3] <= 0:
+                    continue
+            search_gray = np.ascontiguousarray(frame.gray_crop(*area))
+            for _ in range(repeat):
+                start = time.perf_counter()
+                detector._perform_match(search_gray, template)
+                samples.append(time.perf_counter() - start)
+        if samples:
+            report[name] = summarize(samples)
+    return report
+
+
+def bench_find(detector, frames, repeat):
+    """
+    find() per template and radius, on fresh frames with gray precomputed.
+
+    "name@rN" times the search without a previous hit, so repeats don't
+    all take the last-hit shortcut. "name@rN+track" times the same lookup
+    right after a hit on the same frame, i.e. the tracking path, over the
+    frames where the template was found.
+    """
+    report = {}
+    grays = [cv.cvtColor(bgr, cv.COLOR_BGR2GRAY) for bgr, _ in frames]
+    for name in detector.templates:
+        for radius in sorted({0, *STATE_RADII.get(name, ())}):
+            samples = []
+            tracked = []
+            found = 0
+            for (bgr, origin), gray in zip(frames, grays):
+                for _ in range(repeat):
+                    detector._last_hits.pop(name, None)
+                    frame = Frame(bgr, origin=origin, gray=gray)
+                    start = time.perf_counter()
+                    result = detector.find(frame, name, radius)
+                    samples.append(time.perf_counter() - start)
+                    found += result is not None
+                    if result is None or not detector.templates[name].track_last_hit:
+                        continue
+
+                    frame = Frame(bgr, origin=origin, gray=gray)
+                    start = time.perf_counter()
+                    detector.find(frame, name, radius)
+                    tracked.append(time.perf_counter() - start)
+            detector._last_hits.pop(name, None)
+
+            stats = summarize(samples)
+            stats["found_ratio"] = found / len(samples)
+            report[f"{name}@r{radius}"] = stats
+            if tracked:
+                report[f"{name}@r{radius}+track"] = summarize(tracked)
+
+    if "left_arrow" in detector.templates and "right_arrow" in detector.templates:
+        samples = []
+        for (bgr, origin), gray in zip(frames, grays):
+            for _ in range(repeat):
+                frame = Frame(bgr, origin=origin, gray=gray)
+                start = time.perf_counter()
+                detector.find_direction(frame)
+                samples.append(time.perf_counter() - start)
+        report["find_direction"] = summarize(samples)
+    return report
+
+
+def print_table(title, section):
+    print(f"\n{title}")
+    print(f"  {'name':<28} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'per sec':>10}")
+    for name, stats in section.items():
+        print(
+            f"  {name:<28} {stats['p50_ms']:>8.3f} {stats['p95_ms']:>8.3f} "
+            f"{stats['p99_ms']:>8.3f} {stats['per_second'] or 0:>10.1f}"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark template detection")
+    parser.add_argument("--recording", help="session directory recorded with record_path")
+    parser.add_argument("--frames", type=int, default=20, help="number of frames to use")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per frame")
+    parser.add_argument("--seed", type=int, default=0, help="seed for synthetic frames")
+    parser.add_argument("--capture", action="store_true", help="also time live screen capture")
+    parser.add_argument("--change-gate", action="store_true", help="keep the change gate enabled")
+    parser.add_argument("--output", default="benchmark.json", help="JSON report path")
+    args = parser.parse_args(argv)
+
+    detector = make_detector(args)
+    frames, truths = load_frames(args, detector.detection_config)
+    if not frames:
+        parser.error("no frames to benchmark")
+
+    log(f"[INFO] ⏱️ Benchmarking {len(detector.templates)} templates on {len(frames)} frames")
+    report = {
+        "source": args.recording or "synthetic",
+        "frames": len(frames),
+        "repeat": args.repeat,
+        "change_gate": args.change_gate,
+        "platform": platform.platform(),
+        "opencv": cv.__version__,
+        "match": bench_match(detector, frames, args.repeat),
+        "find": bench_find(detector, frames, args.repeat),
+    }
+    if truths is not None:
+        samples = [(bgr, origin, truth) for (bgr, origin), truth in zip(frames, truths)]
+        report["accuracy"] = evaluate(detector, samples, STATE_RADII)
+    if args.capture:
+        try:
+            report["capture"] = bench_capture(detector, args.repeat * len(frames))
+        except Exception as e:
+            log(f"[ERROR] Screen capture unavailable, skipping it: {e}")
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+
+    print_table("_perform_match", report["match"])
+    print_table("find", report["find"])
+    if "capture" in report:
+        print_table("capture_screen", report["capture"])
+    if "accuracy" in report:
+        misses = {
+            name: counts for name, counts in report["accuracy"].items()
+            if counts["fp"] or counts["fn"] or counts["off_center"]
+        }
+        print(f"\naccuracy: {len(report['accuracy']) - len(misses)}/{len(report['accuracy'])} clean")
+        for name, counts in misses.items():
+            print(f"  {name:<24} {counts}")
+    log(f"[INFO] 💾 Report written to '{args.output}'")
+
+
+if __name__ == "__main__":
+    main()
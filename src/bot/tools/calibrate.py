@@ -0,0 +1,161 @@
+"""
+ROI calibration.
+
+Searches the whole frame for every template, on a recording or on a live
+guided session, and saves tight ROIs around the observed hits (plus a
+margin) for the window size. The detector loads them at startup when
+DetectionConfig.use_calibration is set.
+
+    python -m src.bot.tools.calibrate --recording recordings/session1
+    python -m src.bot.tools.calibrate --live 120
+
+In a live session, play normally until every template you care about has
+been seen; templates still missing are listed every few seconds.
+"""
+import argparse
+import time
+
+from ..config import Config
+from ..config.calibration import save_calibration
+from ..config.paths import CALIBRATION_PATH
+from ..core.game.detector import Detector
+from ..core.game.frame import Frame
+from ..core.game.recorder import iter_recording, load_session
+from ..utils.logger import log
+
+
+class RoiCalibrator:
+    """
+    Collects full-frame hits per template and turns them into ROIs.
+
+    A hit needs at least min_confidence (never less than the template's own
+    threshold), since a false hit anywhere on screen would blow the ROI up.
+    """
+
+    def __init__(self, detector, min_confidence=0.8, margin=10):
+        self.detector = detector
+        self.min_confidence = min_confidence
+        self.margin = margin
+        self.hits = {name: [] for name in detector.templates}
+        self.frames = 0
+
+    def add_frame(self, frame):
+        """Search one frame; returns the names of templates seen for the first time"""
+        self.frames += 1
+        area = (frame.left, frame.top, frame.right - frame.left, frame.bottom - frame.top)
+        search_gray = frame.gray_crop(*area)
+
+        new = []
+        for name, template in self.detector.templates.items():
+            confidence, location = self.detector._perform_match(search_gray, template)
+            if confidence is None or confidence < max(self.min_confidence, template.threshold):
+                continue
+            if not self.hits[name]:
+                new.append(name)
+            self.hits[name].append((location[0] + frame.left, location[1] + frame.top))
+        return new
+
+    def missing(self):
+        return [name for name, hits in self.hits.items() if not hits]
+
+    def rois(self, min_hits=1):
+        """Bounding box of each template's hits, padded by the margin and clamped to the screen"""
+        width = self.detector.monitor['width']
+        height = self.detector.monitor['height']
+        rois = {}
+        for name, hits in self.hits.items():
+            if len(hits) < min_hits:
+                continue
+            template = self.detector.templates[name]
+            left = max(0, min(x for x, _ in hits) - self.margin)
+            top = max(0, min(y for _, y in hits) - self.margin)
+            right = min(width, max(x for x, _ in hits) + template.width + self.margin)
+            bottom = min(height, max(y for _, y in hits) + template.height + self.margin)
+            rois[name] = (left, top, right - left, bottom - top)
+        return rois
+
+
+def make_detector(width=None, height=None):
+    config = Config()
+    # Calibrate against the configured layout, not an earlier calibration
+    config.bot.detection.use_calibration = False
+    if width and height:
+        screen = config.bot.screen
+        screen.follow_window = False
+        screen.monitor_x, screen.monitor_y = 0, 0
+        screen.monitor_width, screen.monitor_height = width, height
+
+    detector = Detector(config)
+    detector.change_gate = None
+    return detector
+
+
+def calibrate_recording(calibrator, path):
+    for bgr, timestamp, origin in iter_recording(path):
+        for name in calibrator.add_frame(Frame(bgr, timestamp=timestamp, origin=origin)):
+            log(f"[INFO] 🎯 Found '{name}' at frame {calibrator.frames}")
+
+
+def calibrate_live(calibrator, duration, interval):
+    log(f"[INFO] 🎮 Calibrating for {duration:.0f}s - play normally so every screen shows up")
+    deadline = time.perf_counter() + duration
+    last_report = 0.0
+    while time.perf_counter() < deadline and calibrator.missing():
+        started = time.perf_counter()
+        for name in calibrator.add_frame(calibrator.detector.capture_screen()):
+            log(f"[INFO] 🎯 Found '{name}'")
+
+        if started - last_report >= 10:
+            log(f"[INFO] ⏳ Still missing: {', '.join(calibrator.missing()) or 'nothing'}")
+            last_report = started
+        time.sleep(max(0.0, interval - (time.perf_counter() - started)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Calibrate template ROIs for the current window size")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--recording", help="session directory recorded with record_path")
+    source.add_argument("--live", type=float, metavar="SECONDS", help="capture the game for this long")
+    parser.add_argument("--interval", type=float, default=0.25, help="seconds between live captures")
+    parser.add_argument("--margin", type=int, default=10, help="pixels added around the observed hits")
+    parser.add_argument("--min-confidence", type=float, default=0.8, help="confidence a hit needs")
+    parser.add_argument("--min-hits", type=int, default=1, help="hits a template needs to be calibrated")
+    parser.add_argument("--output", default=str(CALIBRATION_PATH), help="calibration file")
+    parser.add_argument("--dry-run", action="store_true", help="print the ROIs without saving them")
+    args = parser.parse_args(argv)
+
+    if args.recording:
+        session = load_session(args.recording)
+        detector = make_detector(session["width"], session["height"])
+    else:
+        detector = make_detector()
+
+    calibrator = RoiCalibrator(detector, args.min_confidence, args.margin)
+    if args.recording:
+        calibrate_recording(calibrator, args.recording)
+    else:
+        calibrate_live(calibrator, args.live, args.interval)
+
+    rois = calibrator.rois(args.min_hits)
+    width, height = detector.monitor['width'], detector.monitor['height']
+    print(f"\n  {'name':<18} {'hits':>5} {'configured':>22} {'calibrated':>22} {'area':>6}")
+    for name in detector.templates:
+        configured = detector._resolve_roi(name)
+        calibrated = rois.get(name)
+        ratio = ""
+        if configured and calibrated:
+            ratio = f"{calibrated[2] * calibrated[3] / (configured[2] * configured[3]):.0%}"
+        print(f"  {name:<18} {len(calibrator.hits[name]):>5} {str(configured):>22} {str(calibrated or '-'):>22} {ratio:>6}")
+
+    if not rois:
+        log("[INFO] ❌ No template was found; nothing to save")
+        return
+    if args.dry_run:
+        return
+
+    save_calibration(width, height, rois, calibrator.frames, args.output)
+    log(f"[INFO] 💾 Saved {len(rois)} ROIs for {width}x{height} to '{args.output}'")
+
+
+if __name__ == "__main__":
+    main()
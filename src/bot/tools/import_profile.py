@@ -0,0 +1,150 @@
+"""
+Import-time profile.
+
+Imports each target module in a fresh interpreter under `python -X
+importtime` and reports what its import costs: the wall time of the
+interpreter, the cumulative import time of the module, the slowest
+modules it pulled in, and the self time summed per top-level package
+(cv2, numpy, PyQt6, ...). With --budget-ms the exit status is 1 when a
+target's import takes longer than the budget, so startup regressions can
+be caught in a script.
+
+    python -m src.bot.tools.import_profile
+    python -m src.bot.tools.import_profile main_new src.bot.core.game.detector --budget-ms 150
+"""
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+from ..config.paths import PACKAGE_ROOT
+from ..utils.logger import log
+
+PROJECT_ROOT = PACKAGE_ROOT.parent.parent
+
+# What the CLI menu and a headless detection run import before doing anything
+DEFAULT_TARGETS = (
+    "main_new",
+    "src.bot.bots.fishing",
+    "src.bot.core.game.hotkeys",
+    "src.bot.core.game.detector",
+)
+
+IMPORTTIME_PREFIX = "import time:"
+
+
+def parse_importtime(stderr):
+    """
+    (entries, other_lines) from -X importtime output. Each entry is a dict
+    with the module name, its nesting depth, and self and cumulative times
+    in milliseconds, in the order the imports finished.
+    """
+    entries, other = [], []
+    for line in stderr.splitlines():
+        if not line.startswith(IMPORTTIME_PREFIX):
+            other.append(line)
+            continue
+        fields = line[len(IMPORTTIME_PREFIX):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # the header line
+        name = fields[2].rstrip()
+        stripped = name.lstrip()
+        entries.append({
+            "module": stripped,
+            "depth": (len(name) - len(stripped) - 1) // 2,
+            "self_ms": int(fields[0]) / 1000,
+            "cumulative_ms": int(fields[1]) / 1000,
+        })
+    return entries, other
+
+
+def profile_import(module, python=sys.executable):
+    """Import one module in a fresh interpreter and parse its import times"""
+    start = time.perf_counter()
+    result = subprocess.run(
+        [python, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT, capture_output=True, text=True,
+    )
+    wall_ms = (time.perf_counter() - start) * 1000
+    entries, other = parse_importtime(result.stderr)
+    return {
+        "wall_ms": wall_ms,
+        "ok": result.returncode == 0,
+        "error": other[-1] if result.returncode and other else None,
+        "entries": entries,
+    }
+
+
+def summarize(module, runs, top):
+    """Fastest of the runs (the others paid for cold disk caches)"""
+    best = min(runs, key=lambda run: run["wall_ms"])
+    entries = best["entries"]
+    target = next((e for e in entries if e["module"] == module), None)
+
+    packages = {}
+    for entry in entries:
+        package = entry["module"].split(".")[0]
+        packages[package] = packages.get(package, 0.0) + entry["self_ms"]
+
+    by_cumulative = sorted(entries, key=lambda e: e["cumulative_ms"], reverse=True)
+    return {
+        "ok": best["ok"],
+        "error": best["error"],
+        "wall_ms": best["wall_ms"],
+        "import_ms": target["cumulative_ms"] if target else None,
+        "modules": len(entries),
+        "slowest": [
+            {"module": e["module"], "cumulative_ms": e["cumulative_ms"], "self_ms": e["self_ms"]}
+            for e in by_cumulative if e["module"] != module
+        ][:top],
+        "packages": dict(sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Profile module import times")
+    parser.add_argument("targets", nargs="*", default=DEFAULT_TARGETS, help="modules to import")
+    parser.add_argument("--runs", type=int, default=3, help="fresh interpreters per target")
+    parser.add_argument("--top", type=int, default=10, help="modules and packages to list")
+    parser.add_argument("--budget-ms", type=float, help="fail when a target's import takes longer")
+    parser.add_argument("--output", help="JSON report path")
+    args = parser.parse_args(argv)
+
+    report = {}
+    for module in args.targets:
+        runs = [profile_import(module) for _ in range(args.runs)]
+        report[module] = summarize(module, runs, args.top)
+
+    over_budget = []
+    for module, entry in report.items():
+        print(f"\n{module}")
+        if not entry["ok"]:
+            print(f"  import failed: {entry['error']}")
+        import_ms = entry["import_ms"]
+        print(
+            f"  wall {entry['wall_ms']:.1f} ms, import "
+            f"{'-' if import_ms is None else f'{import_ms:.1f}'} ms, {entry['modules']} modules"
+        )
+        print(f"  {'slowest imports':<40} {'cumul ms':>9} {'self ms':>8}")
+        for slow in entry["slowest"]:
+            print(f"  {slow['module']:<40} {slow['cumulative_ms']:>9.1f} {slow['self_ms']:>8.1f}")
+        print(f"  {'package':<40} {'self ms':>9}")
+        for package, self_ms in entry["packages"].items():
+            print(f"  {package:<40} {self_ms:>9.1f}")
+
+        if args.budget_ms is not None and (import_ms is None or import_ms > args.budget_ms):
+            over_budget.append(module)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        log(f"[INFO] 💾 Report written to '{args.output}'")
+
+    if over_budget:
+        log(f"[ERROR] ❌ Over the {args.budget_ms:.0f} ms budget: {', '.join(over_budget)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+Precision sweep.
+
+Scores every template on labelled frames (synthetic, or a recording with
+labels.json) and reports, per template, the confidence distributions of
+frames where it is present and absent, the ROC curve, and the threshold
+that separates the two best. Suggested thresholds go into the "threshold"
+entry of DetectionConfig.template_settings.
+
+    python -m src.bot.tools.precision_sweep --frames 200 --output sweep.json
+"""
+import argparse
+import json
+
+import numpy as np
+
+from ..core.game.frame import Frame
+from ..utils.logger import log
+from .benchmark import STATE_RADII, load_frames, make_detector
+from .synthetic_frames import expected_found
+
+HISTOGRAM_BINS = 20
+
+
+def collect_scores(detector, samples, name, radius):
+    """Confidences on frames where the template should and should not be found"""
+    positives, negatives = [], []
+    for bgr, origin, truth in samples:
+        label = truth["templates"].get(name)
+        if label is not None and not expected_found(label, radius):
+            continue  # present but out of reach of this radius; neither
+        confidence = detector.score(Frame(bgr, origin=origin), name, radius)
+        if confidence is None:
+            confidence = 0.0
+        (positives if label is not None else negatives).append(float(confidence))
+    return positives, negatives
+
+
+def roc_curve(positives, negatives):
+    """
+    (thresholds, tpr, fpr) where a confidence >= threshold counts as a
+    match, from the strictest threshold to the loosest
+    """
+    positives = np.asarray(positives)
+    negatives = np.asarray(negatives)
+    thresholds = np.unique(np.concatenate([positives, negatives]))[::-1]
+    tpr = np.array([(positives >= t).mean() if positives.size else 0.0 for t in thresholds])
+    fpr = np.array([(negatives >= t).mean() if negatives.size else 0.0 for t in thresholds])
+    return thresholds, tpr, fpr
+
+
+def distribution(values):
+    values = np.asarray(values)
+    if not values.size:
+        return {"count": 0}
+    hist, _ = np.histogram(values, bins=HISTOGRAM_BINS, range=(0.0, 1.0))
+    return {
+        "count": int(values.size),
+        "min": float(values.min()),
+        "p5": float(np.percentile(values, 5)),
+        "p50": float(np.percentile(values, 50)),
+        "p95": float(np.percentile(values, 95)),
+        "max": float(values.max()),
+        "histogram": hist.tolist(),
+    }
+
+
+def sweep(positives, negatives, current):
+    """
+    Summary for one template. The suggested threshold is the middle of the
+    gap between the highest absent and the lowest present confidence when
+    the two don't overlap, so neither side sits on the edge. Otherwise it is
+    the threshold with the best Youden's J (TPR - FPR).
+    """
+    report = {
+        "positives": distribution(positives),
+        "negatives": distribution(negatives),
+        "current_threshold": current,
+    }
+    if not positives or not negatives:
+        report["suggested_threshold"] = None
+        return report
+
+    thresholds, tpr, fpr = roc_curve(positives, negatives)
+    # Close the curve at (0, 0) and (1, 1) and integrate with trapezoids
+    x = np.concatenate([[0.0], fpr, [1.0]])
+    y = np.concatenate([[0.0], tpr, [1.0]])
+    auc = float(np.sum(np.diff(x) * (y[1:] + y[:-1]) / 2))
+    best = int(np.argmax(tpr - fpr))
+
+    lowest_positive = min(positives)
+    highest_negative = max(negatives)
+    separable = lowest_positive > highest_negative
+    suggested = (lowest_positive + highest_negative) / 2 if separable else float(thresholds[best])
+
+    report.update({
+        "auc": auc,
+        "separable": separable,
+        "margin": lowest_positive - highest_negative,
+        "best_j": {
+            "threshold": float(thresholds[best]),
+            "tpr": float(tpr[best]),
+            "fpr": float(fpr[best]),
+        },
+        "suggested_threshold": round(suggested, 3),
+        "at_current": {
+            "tpr": float(np.mean(np.asarray(positives) >= current)),
+            "fpr": float(np.mean(np.asarray(negatives) >= current)),
+        },
+        "roc": {
+            "thresholds": thresholds.tolist(),
+            "tpr": tpr.tolist(),
+            "fpr": fpr.tolist(),
+        },
+    })
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Per-template precision sweep and ROC report")
+    parser.add_argument("--recording", help="recording directory with labels.json")
+    parser.add_argument("--frames", type=int, default=200, help="number of frames to use")
+    parser.add_argument("--seed", type=int, default=0, help="seed for synthetic frames")
+    parser.add_argument("--output", default="precision_sweep.json", help="JSON report path")
+    args = parser.parse_args(argv)
+    args.change_gate = False
+
+    detector = make_detector(args)
+    frames, truths = load_frames(args, detector.detection_config)
+    if truths is None:
+        parser.error(f"'{args.recording}' has no labels.json")
+    samples = [(bgr, origin, truth) for (bgr, origin), truth in zip(frames, truths)]
+
+    log(f"[INFO] 📈 Sweeping {len(detector.templates)} templates on {len(samples)} labelled frames")
+    report = {}
+    for name, template in detector.templates.items():
+        for radius in sorted({0, *STATE_RADII.get(name, ())}):
+            positives, negatives = collect_scores(detector, samples, name, radius)
+            report[f"{name}@r{radius}"] = sweep(positives, negatives, template.threshold)
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+
+    print(f"\n  {'name':<24} {'auc':>6} {'margin':>7} {'suggested':>10} {'fpr@now':>8} {'tpr@now':>8}")
+    for name, entry in report.items():
+        if entry["suggested_threshold"] is None:
+            print(f"  {name:<24} {'(needs present and absent frames)':>42}")
+            continue
+        print(
+            f"  {name:<24} {entry['auc']:>6.3f} {entry['margin']:>7.3f} {entry['suggested_threshold']:>10.3f} "
+            f"{entry['at_current']['fpr']:>8.2%} {entry['at_current']['tpr']:>8.2%}"
+        )
+    log(f"[INFO] 💾 Report written to '{args.output}'")
+
+
+if __name__ == "__main__":
+    main()
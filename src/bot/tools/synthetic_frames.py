@@ -0,0 +1,270 @@
+"""
+Synthetic frame generator.
+
+Composites the template PNGs (with their alpha masks) onto varied
+backgrounds at known positions, scales, brightness and noise levels, inside
+their configured ROIs or poking just outside them, and labels every frame
+with the ground truth. The same seed always yields the same frames.
+
+    python -m src.bot.tools.synthetic_frames --count 200 --output recordings/synthetic
+
+writes the frames as a recording (see core/game/recorder.py) together with
+labels.json.
+"""
+import argparse
+import json
+
+import cv2 as cv
+import numpy as np
+
+from ..config.detection_config import DetectionConfig
+from ..config.paths import TEMPLATES_PATH
+from ..core.game.frame import Frame
+from ..core.game.recorder import SessionRecorder
+from ..core.game.scaling import ResolutionScaler
+from ..utils.logger import log
+
+BACKGROUNDS = ("noise", "gradient", "solid", "blobs")
+
+
+class SyntheticFrameGenerator:
+    """
+    Deterministic source of labelled frames.
+
+    Each template appears with probability `presence`. A share
+    `outside_ratio` of the placed templates is shifted so that it extends
+    1 to `outside_margin` pixels past an edge of its ROI; `outside_by` in
+    its label records by how much, so a search with at least that radius
+    should still find it. Templates never overlap each other.
+
+    resolution renders the whole layout for another client size the same
+    way the detector scales it. scale_jitter additionally resizes each
+    pasted template by a random factor in [1 - jitter, 1 + jitter].
+    """
+
+    def __init__(
+        self,
+        detection_config=None,
+        resolution=None,
+        seed=0,
+        presence=0.5,
+        outside_ratio=0.2,
+        outside_margin=8,
+        scale_jitter=0.0,
+        brightness=(0.9, 1.1),
+        noise=(0.0, 4.0),
+        backgrounds=BACKGROUNDS,
+        templates_path=TEMPLATES_PATH,
+    ):
+        self.detection_config = detection_config or DetectionConfig()
+        base = self.detection_config.base_resolution
+        self.width, self.height = resolution or base
+        self.scaler = ResolutionScaler(base, self.width, self.height)
+        self.rng = np.random.default_rng(seed)
+        self.presence = presence
+        self.outside_ratio = outside_ratio
+        self.outside_margin = outside_margin
+        self.scale_jitter = scale_jitter
+        self.brightness = brightness
+        self.noise = noise
+        self.backgrounds = backgrounds
+
+        self.images = {}
+        for name, filename in self.detection_config.templates.items():
+            image = cv.imread(str(templates_path / filename), cv.IMREAD_UNCHANGED)
+            if image is None:
+                continue
+            if image.ndim == 2:
+                image = cv.cvtColor(image, cv.COLOR_GRAY2BGR)
+            self.images[name] = self._resize(image, self.scaler.template_scale)
+
+        rois = {}
+        for name, roi in self.detection_config.rois.items():
+            if isinstance(roi, str):
+                roi = self.detection_config.rois.get(roi)
+            rois[name] = roi
+        sizes = {name: (image.shape[1], image.shape[0]) for name, image in self.images.items()}
+        self.rois = self.scaler.scale_rois(rois, sizes)
+
+    @staticmethod
+    def _resize(image, scale):
+        """Resize the way compile_template does, so template sizes agree"""
+        if scale == 1.0:
+            return image
+        size = (max(1, round(image.shape[1] * scale)), max(1, round(image.shape[0] * scale)))
+        interpolation = cv.INTER_AREA if scale < 1.0 else cv.INTER_LINEAR
+        return cv.resize(image, size, interpolation=interpolation)
+
+    def _background(self, kind):
+        rng = self.rng
+        shape = (self.height, self.width, 3)
+        if kind == "solid":
+            return np.full(shape, rng.integers(0, 256, 3), dtype=np.uint8)
+        if kind == "gradient":
+            start, end = rng.integers(0, 256, (2, 3))
+            ramp = np.linspace(0, 1, self.width, dtype=np.float32)[None, :, None]
+            return np.broadcast_to(start + (end - start) * ramp, shape).astype(np.uint8)
+        if kind == "blobs":
+            small = rng.integers(0, 256, (self.height // 40 + 1, self.width // 40 + 1, 3), dtype=np.uint8)
+            return cv.resize(small, (self.width, self.height), interpolation=cv.INTER_CUBIC)
+        return cv.GaussianBlur(rng.integers(0, 256, shape, dtype=np.uint8), (7, 7), 0)
+
+    def _place(self, roi, tw, th):
+        """Top-left corner inside the ROI, or pushed past one of its edges"""
+        rng = self.rng
+        x, y, w, h = roi
+        px = x + int(rng.integers(0, max(1, w - tw + 1)))
+        py = y + int(rng.integers(0, max(1, h - th + 1)))
+        if rng.random() >= self.outside_ratio:
+            return px, py, 0
+
+        outside_by = int(rng.integers(1, self.outside_margin + 1))
+        side = rng.integers(4)
+        if side == 0:
+            px = x - outside_by
+        elif side == 1:
+            px = x + max(w, tw) - tw + outside_by
+        elif side == 2:
+            py = y - outside_by
+        else:
+            py = y + max(h, th) - th + outside_by
+        return px, py, outside_by
+
+    def generate(self):
+        """
+        Returns (bgr, truth). truth holds the background kind, the noise
+        sigma and, under "templates", a label per pasted template with its
+        rect, center (as Detector.find reports it), outside_by, scale and
+        brightness.
+        """
+        rng = self.rng
+        background = self.backgrounds[rng.integers(len(self.backgrounds))]
+        bgr = self._background(background).copy()
+        occupied = []
+        labels = {}
+
+        # Shuffle so templates with overlapping ROIs all get their turn
+        for name in rng.permutation(list(self.images)):
+            image = self.images[name]
+            roi = self.rois.get(name)
+            if not roi or rng.random() >= self.presence:
+                continue
+
+            scale = 1.0
+            if self.scale_jitter:
+                scale = float(rng.uniform(1 - self.scale_jitter, 1 + self.scale_jitter))
+                image = self._resize(image, scale)
+            th, tw = image.shape[:2]
+            px, py, outside_by = self._place(roi, tw, th)
+            rect = (px, py, tw, th)
+
+            if px < 0 or py < 0 or px + tw > self.width or py + th > self.height:
+                continue
+            if any(_overlaps(rect, other) for other in occupied):
+                continue
+            occupied.append(rect)
+
+            gain = float(rng.uniform(*self.brightness))
+            color = image[:, :, :3].astype(np.float32) * gain
+            region = bgr[py:py + th, px:px + tw]
+            if image.shape[2] == 4:
+                alpha = image[:, :, 3:4].astype(np.float32) / 255.0
+                color = color * alpha + region * (1 - alpha)
+            region[:] = np.clip(color, 0, 255).astype(np.uint8)
+
+            labels[str(name)] = {
+                "rect": rect,
+                "center": (px + tw // 2, py + th // 2),
+                "outside_by": outside_by,
+                "scale": scale,
+                "brightness": gain,
+            }
+
+        sigma = float(rng.uniform(*self.noise))
+        if sigma > 0:
+            noisy = bgr.astype(np.float32) + rng.normal(0, sigma, bgr.shape).astype(np.float32)
+            bgr = np.clip(noisy, 0, 255).astype(np.uint8)
+
+        return bgr, {"background": background, "noise": sigma, "templates": labels}
+
+    def frames(self, count):
+        for _ in range(count):
+            yield self.generate()
+
+
+def _overlaps(a, b):
+    ax, ay, aw, ah = a
+    bx, by, bw, bh = b
+    return ax < bx + bw and bx < ax + aw and ay < by + bh and by < ay + ah
+
+
+def expected_found(label, radius):
+    """Whether a search with this radius should find a labelled template"""
+    return label is not None and label["outside_by"] <= radius
+
+
+def evaluate(detector, samples, radii=None, tolerance=2):
+    """
+    Compare detector.find against ground truth.
+
+    samples is a list of (bgr, origin, truth) triples, origin being where
+    a partial (ROI-only) frame sits on the screen, and radii maps template
+    names to the radii to check (0 only by default). Returns, per "name@rN", the
+    counts of true/false positives and negatives, the largest center error
+    of the true positives and how many of those were further than tolerance
+    pixels off.
+    """
+    radii = radii or {}
+    report = {}
+    for name in detector.templates:
+        for radius in sorted({0, *radii.get(name, ())}):
+            counts = {"tp": 0, "fp": 0, "tn": 0, "fn": 0, "max_center_error": 0, "off_center": 0}
+            for bgr, origin, truth in samples:
+                label = truth["templates"].get(name)
+                found = detector.find(Frame(bgr, origin=origin), name, radius)
+                if expected_found(label, radius):
+                    if found is None:
+                        counts["fn"] += 1
+                        continue
+                    counts["tp"] += 1
+                    error = max(abs(found[0] - label["center"][0]), abs(found[1] - label["center"][1]))
+                    counts["max_center_error"] = max(counts["max_center_error"], int(error))
+                    counts["off_center"] += error > tolerance
+                elif label is None:
+                    counts["fp" if found is not None else "tn"] += 1
+            report[f"{name}@r{radius}"] = counts
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate labelled synthetic frames")
+    parser.add_argument("--count", type=int, default=100, help="number of frames")
+    parser.add_argument("--output", required=True, help="directory to write the recording to")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--width", type=int, help="client width (default: base resolution)")
+    parser.add_argument("--height", type=int, help="client height (default: base resolution)")
+    parser.add_argument("--scale-jitter", type=float, default=0.0)
+    parser.add_argument("--outside-ratio", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    resolution = (args.width, args.height) if args.width and args.height else None
+    generator = SyntheticFrameGenerator(
+        resolution=resolution, seed=args.seed,
+        scale_jitter=args.scale_jitter, outside_ratio=args.outside_ratio,
+    )
+
+    recorder = SessionRecorder(args.output, (generator.width, generator.height))
+    labels = []
+    for i, (bgr, truth) in enumerate(generator.frames(args.count)):
+        # Space the frames like a 30 fps capture for replay at recorded speed
+        recorder.record(Frame(bgr, timestamp=i / 30))
+        labels.append(truth)
+    recorder.close()
+
+    with open(recorder.path / "labels.json", "w") as f:
+        json.dump(labels, f, indent=2)
+    log(f"[INFO] 💾 Wrote {args.count} labelled frames to '{recorder.path}'")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+import threading
+import weakref
+from collections import namedtuple
+
+from .logger import log
+
+GAME_WINDOW_TITLE = "Blue Protocol"
+DEFAULT_GEOMETRY = (0, 0, 1920, 1080)
+
+# Client area of the game window in screen coordinates
+WindowGeometry = namedtuple("WindowGeometry", ["x", "y", "width", "height"])
+
+
+class WindowTracker:
+    """
+    Shared, cached geometry of the game window.
+
+    The window is located once by enumerating all windows; after that only
+    the found window is asked for its position and size, and all windows
+    are enumerated again only when it disappears. refresh() re-reads the
+    geometry on demand, and start() does so on a background thread every
+    poll_interval seconds. Subscribers are called with the new
+    WindowGeometry, from the thread that noticed the change, whenever it
+    differs from the previous one.
+
+    pywinctl is imported on first use; without it (or without a display)
+    the default geometry is used.
+    """
+
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, title=GAME_WINDOW_TITLE, default=DEFAULT_GEOMETRY, poll_interval=1.0):
+        self.title = title
+        self.default = WindowGeometry(*default)
+        self.poll_interval = poll_interval
+
+        self._lock = threading.RLock()
+        self._window = None
+        self._geometry = None
+        self._unavailable = False
+        self._subscribers = []
+        self._thread = None
+        self._stop = threading.Event()
+
+    @classmethod
+    def shared(cls, title=GAME_WINDOW_TITLE):
+        """The process-wide tracker for a window title"""
+        with cls._shared_lock:
+            tracker = cls._shared.get(title)
+            if tracker is None:
+                tracker = cls._shared[title] = cls(title)
+            return tracker
+
+    @property
+    def geometry(self):
+        """Cached geometry; the window is located on first access"""
+        if self._geometry is None:
+            self.refresh()
+        return self._geometry
+
+    @property
+    def found(self):
+        return self._window is not None
+
+    def refresh(self):
+        """Re-read the window geometry, notifying subscribers if it changed"""
+        with self._lock:
+            geometry = self._read_geometry()
+            previous, self._geometry = self._geometry, geometry
+
+        if previous is not None and geometry != previous:
+            log(f"[INFO] 🪟 Game window moved to ({geometry.x}, {geometry.y}) {geometry.width}x{geometry.height}")
+            self._notify(geometry)
+        return geometry
+
+    def _read_geometry(self):
+        if self._window is not None:
+            try:
+                if self._window.isAlive:
+                    return self._client_area(self._window)
+            except Exception:
+                pass
+            self._window = None
+            log("[INFO] 🪟 Game window lost, searching again")
+
+        self._window = self._find_window()
+        if self._window is None:
+            return self._geometry or self.default
+        geometry = self._client_area(self._window)
+        log(f"[INFO] 🪟 Game window detected at ({geometry.x}, {geometry.y}) {geometry.width}x{geometry.height}")
+        return geometry
+
+    def _find_window(self):
+        if self._unavailable:
+            return None
+        try:
+            import pywinctl as pwc
+
+            for window in pwc.getAllWindows():
+                if self.title in window.title:
+                    return window
+        except Exception as e:
+            # Missing pywinctl or no display; this will not get better
+            self._unavailable = True
+            log(f"[INFO] Could not detect window ({e}), using defaults")
+            return None
+
+        if self._geometry is None:
+            log("[INFO] Window not found, using defaults")
+        return None
+
+    @staticmethod
+    def _client_area(window):
+        x, y = window.topleft
+        width, height = window.size
+        if x > 0 or y > 0:
+            # Windowed mode: strip the title bar and borders
+            x, y = x + 8, y + 32
+            width, height = width - 16, height - 39
+        return WindowGeometry(x, y, width, height)
+
+    def subscribe(self, callback):
+        """
+        Call callback(geometry) on every geometry change. Bound methods are
+        held weakly, so subscribing does not keep their object alive.
+        """
+        ref = weakref.WeakMethod(callback) if hasattr(callback, "__self__") else (lambda: callback)
+        with self._lock:
+            self._subscribers.append(ref)
+
+    def unsubscribe(self, callback):
+        with self._lock:
+            self._subscribers = [ref for ref in self._subscribers if ref() not in (None, callback)]
+
+    def _notify(self, geometry):
+        with self._lock:
+            callbacks = [ref() for ref in self._subscribers]
+            self._subscribers = [ref for ref, callback in zip(self._subscribers, callbacks) if callback]
+        for callback in callbacks:
+            if callback is None:
+                continue
+            try:
+                callback(geometry)
+            except Exception as e:
+                log(f"[ERROR] Window change handler failed: {e}")
+
+    def start(self):
+        """Poll the window geometry in the background"""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="WindowTracker", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop.set()
+            thread.join(timeout=1.0)
+
+    def is_running(self):
+        return self._thread is not None
+
+    def _run(self):
+        while not self._stop.wait(self.poll_interval):
+            if self._unavailable:
+                break
+            try:
+                self.refresh()
+            except Exception as e:
+                log(f"[ERROR] Window poll failed: {e}")
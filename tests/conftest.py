@@ -0,0 +1,31 @@
+import pytest
+
+from src.bot.config import Config
+from src.bot.core.game.detector import Detector
+
+
+@pytest.fixture
+def make_detector():
+    """
+    Build Detectors laid out for the base resolution, with detection
+    settings overridden by keyword. The template cache is off so tests
+    never write into the package, and the window is not followed.
+    """
+    def make(rois=None, **detection):
+        config = Config()
+        config.bot.detection.template_cache = False
+        config.bot.detection.change_gate = False
+        for key, value in detection.items():
+            setattr(config.bot.detection, key, value)
+
+        screen = config.bot.screen
+        screen.follow_window = False
+        screen.monitor_x, screen.monitor_y = 0, 0
+        screen.monitor_width, screen.monitor_height = config.bot.detection.base_resolution
+
+        detector = Detector(config)
+        if rois is not None:
+            detector.rois = rois
+        return detector
+
+    return make
@@ -0,0 +1,17 @@
+import numpy as np
+
+from src.bot.core.game.frame import Frame
+from src.bot.tools.calibrate import RoiCalibrator
+
+
+def test_flat_frames_record_no_hits(make_detector):
+    detector = make_detector(use_calibration=False)
+    calibrator = RoiCalibrator(detector)
+
+    black = np.zeros((1080, 1920, 3), dtype=np.uint8)
+    half_flat = black.copy()
+    half_flat[:, 960:] = np.random.default_rng(0).integers(0, 256, (1080, 960, 3), dtype=np.uint8)
+
+    for bgr in (black, half_flat):
+        assert calibrator.add_frame(Frame(bgr)) == []
+    assert calibrator.rois() == {}
@@ -0,0 +1,50 @@
+import numpy as np
+
+from src.bot.core.game.change_gate import ChangeGate
+from src.bot.core.game.frame import Frame
+from src.bot.utils.window_tracker import WindowGeometry, WindowTracker
+
+RECT = (0, 0, 64, 64)
+
+
+def test_unchanged_region_reuses_the_result():
+    gate = ChangeGate(threshold=2.0, max_age=0.5)
+    gray = np.random.default_rng(0).integers(0, 256, (64, 64), dtype=np.uint8)
+    gate.store("key", RECT, gate.signature(gray), "result", 0.0)
+
+    assert gate.lookup("key", RECT, gate.signature(gray), 0.1) == (True, "result")
+    assert gate.lookup("key", RECT, gate.signature(255 - gray), 0.1) == (False, None)
+    assert gate.lookup("key", (1, 0, 64, 64), gate.signature(gray), 0.1) == (False, None)
+    assert gate.lookup("other", RECT, gate.signature(gray), 0.1) == (False, None)
+    assert gate.stats == {"hits": 1, "misses": 3}
+
+
+def test_result_expires_after_max_age():
+    gate = ChangeGate(threshold=2.0, max_age=0.5)
+    gray = np.zeros((64, 64), dtype=np.uint8)
+    gate.store("key", RECT, gate.signature(gray), "result", 10.0)
+
+    assert gate.lookup("key", RECT, gate.signature(gray), 10.5)[0]
+    assert not gate.lookup("key", RECT, gate.signature(gray), 10.6)[0]
+    # A frame from before the entry was stored is not served from it either
+    assert not gate.lookup("key", RECT, gate.signature(gray), 9.9)[0]
+
+
+def test_window_move_invalidates_the_gate(make_detector):
+    detector = make_detector(change_gate=True)
+    tracker = WindowTracker("test window")
+    tracker._geometry = WindowGeometry(0, 0, *detector.detection_config.base_resolution)
+    detector.screen_config.tracker = tracker
+
+    bgr = np.random.default_rng(0).integers(0, 256, (1080, 1920, 3), dtype=np.uint8)
+    detector.find(Frame(bgr, timestamp=1.0), "continue")
+    detector.find(Frame(bgr, timestamp=1.1), "continue")
+    assert detector.change_gate.stats == {"hits": 1, "misses": 1}
+
+    tracker._geometry = tracker._geometry._replace(x=100, y=50)
+    detector._on_window_change(tracker._geometry)
+    detector._follow_window()
+    assert (detector.monitor['left'], detector.monitor['top']) == (100, 50)
+
+    detector.find(Frame(bgr, timestamp=1.2), "continue")
+    assert detector.change_gate.stats == {"hits": 1, "misses": 2}
@@ -0,0 +1,118 @@
+import cv2 as cv
+import numpy as np
+
+from src.bot.core.game.frame import Frame
+from src.bot.tools.synthetic_frames import SyntheticFrameGenerator
+
+
+def _paste(bgr, image, x, y):
+    h, w = image.shape[:2]
+    region = bgr[y:y + h, x:x + w]
+    color = image[:, :, :3].astype(np.float32)
+    if image.shape[2] == 4:
+        alpha = image[:, :, 3:4].astype(np.float32) / 255.0
+        color = color * alpha + region * (1 - alpha)
+    region[:] = color.astype(np.uint8)
+
+
+def test_flat_frame_after_a_hit_is_not_a_hit(make_detector):
+    detector = make_detector()
+    generator = SyntheticFrameGenerator(detector.detection_config)
+    radius = 5
+    rng = np.random.default_rng(0)
+
+    for name in ("fishing_spot_btn", "sturdy_rod", "reg_rod"):
+        # A real hit in the top-left corner of the search area (ROI padded
+        # by the radius), so the last-hit window is clipped by the area
+        x, y, _, _ = detector._resolve_roi(name)
+        bgr = rng.integers(0, 256, (1080, 1920, 3), dtype=np.uint8)
+        _paste(bgr, generator.images[name], x - radius, y - radius)
+        assert detector.find(Frame(bgr), name, radius) is not None, name
+
+        black = np.zeros_like(bgr)
+        assert detector.find(Frame(black), name, radius) is None, name
+
+
+def test_find_direction(make_detector):
+    detector = make_detector()
+    generator = SyntheticFrameGenerator(detector.detection_config)
+    rng = np.random.default_rng(1)
+    noise = rng.integers(0, 256, (1080, 1920, 3), dtype=np.uint8)
+
+    # No arrow: on noise, on black, and on black with one bright pixel in
+    # each ROI, which masked matching scores inf at many positions
+    frames = [noise, np.zeros_like(noise)]
+    for dx in range(0, detector._resolve_roi("left_arrow")[2], 10):
+        speck = np.zeros_like(noise)
+        for name in ("left_arrow", "right_arrow"):
+            x, y, _, h = detector._resolve_roi(name)
+            speck[y + h // 3, x + dx] = 255
+        frames.append(speck)
+    for bgr in frames:
+        direction, _, _ = detector.find_direction(Frame(bgr))
+        assert direction is None
+
+    for direction, name in (("left", "left_arrow"), ("right", "right_arrow")):
+        x, y, w, h = detector._resolve_roi(name)
+        image = generator.images[name]
+        bgr = noise.copy()
+        _paste(bgr, image, x + (w - image.shape[1]) // 2, y + (h - image.shape[0]) // 2)
+        assert detector.find_direction(Frame(bgr))[0] == direction
+
+
+def test_prefilter_rejects_frames_without_the_template_intensities(make_detector, monkeypatch):
+    detector = make_detector()
+    generator = SyntheticFrameGenerator(detector.detection_config)
+    rng = np.random.default_rng(2)
+    # A dark scene with a little sensor noise
+    dark = (rng.normal(30, 3, (1080, 1920, 3))).clip(0, 255).astype(np.uint8)
+
+    for name in ("success", "failure"):
+        template = detector.templates[name]
+        assert template.prefilter, name
+        calls = []
+
+        def counting_match(gray, match=template.match, calls=calls):
+            calls.append(gray.shape)
+            return match(gray)
+
+        monkeypatch.setattr(template, "match", counting_match)
+
+        assert detector.find(Frame(dark), name) is None, name
+        assert not calls, name
+
+        x, y, w, h = detector._resolve_roi(name)
+        image = generator.images[name]
+        bgr = dark.copy()
+        _paste(bgr, image, x + (w - image.shape[1]) // 2, y + (h - image.shape[0]) // 2)
+        assert detector.find(Frame(bgr), name) is not None, name
+        assert calls, name
+
+
+def test_color_threshold_keeps_the_exclamation_and_rejects_other_colors(make_detector):
+    detector = make_detector()
+    template = detector.templates["exclamation"]
+    assert template.strategy == "color_threshold"
+
+    generator = SyntheticFrameGenerator(detector.detection_config)
+    image = generator.images["exclamation"]
+    # The same shape in blue, and an orange mark too small to be the icon
+    recolored = image[:, :, [2, 1, 0, 3]]
+    small = cv.resize(image, (image.shape[1] // 3, image.shape[0] // 3), interpolation=cv.INTER_AREA)
+
+    x, y, w, h = detector._resolve_roi("exclamation")
+    px, py = x + (w - image.shape[1]) // 2, y + (h - image.shape[0]) // 2
+    rng = np.random.default_rng(3)
+    for background in (rng.integers(0, 256, (1080, 1920, 3), dtype=np.uint8), np.full((1080, 1920, 3), 30, np.uint8)):
+        assert detector.find(Frame(background), "exclamation") is None
+        for other in (recolored, small):
+            bgr = background.copy()
+            _paste(bgr, other, px, py)
+            assert detector.find(Frame(bgr), "exclamation") is None
+
+        bgr = background.copy()
+        _paste(bgr, image, px, py)
+        found = detector.find(Frame(bgr), "exclamation")
+        assert found is not None
+        center = (px + image.shape[1] // 2, py + image.shape[0] // 2)
+        assert max(abs(found[0] - center[0]), abs(found[1] - center[1])) <= 2
@@ -0,0 +1,23 @@
+import numpy as np
+
+from src.bot.core.game.frame import Frame
+
+
+def partial_frame():
+    # A 200x100 ROI capture whose top-left corner is at (900, 400)
+    return Frame(np.zeros((100, 200, 3), dtype=np.uint8), origin=(900, 400))
+
+
+def test_clamp_inside_is_unchanged():
+    assert partial_frame().clamp(950, 420, 50, 30) == (950, 420, 50, 30)
+
+
+def test_clamp_intersects_partial_overlap():
+    assert partial_frame().clamp(880, 390, 50, 50) == (900, 400, 30, 40)
+    assert partial_frame().clamp(1080, 480, 50, 50) == (1080, 480, 20, 20)
+
+
+def test_clamp_outside_is_empty():
+    for rect in [(100, 100, 50, 50), (1200, 400, 50, 50), (900, 600, 50, 50)]:
+        _, _, w, h = partial_frame().clamp(*rect)
+        assert w <= 0 or h <= 0
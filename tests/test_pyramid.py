@@ -0,0 +1,13 @@
+from src.bot.core.game.frame import Frame
+from src.bot.tools.synthetic_frames import SyntheticFrameGenerator
+
+
+def test_pyramid_finds_what_direct_search_finds(make_detector):
+    pyramid = make_detector(rois={}, full_frame_search="pyramid", track_last_hit=False)
+    direct = make_detector(rois={}, full_frame_search="direct", track_last_hit=False)
+    generator = SyntheticFrameGenerator(pyramid.detection_config, seed=1)
+
+    for bgr, truth in generator.frames(12):
+        for name in truth["templates"]:
+            expected = direct.find(Frame(bgr), name)
+            assert pyramid.find(Frame(bgr), name) == expected, name
@@ -0,0 +1,46 @@
+import numpy as np
+
+from src.bot.core.game.frame import Frame
+from src.bot.tools.synthetic_frames import SyntheticFrameGenerator
+
+RADIUS = 4
+
+
+def _flatten_patches(bgr, detector, names, rng):
+    """
+    Black out each ROI, padded by the radius, except for a few lone bright
+    pixels: masked windows over such a patch score nan or inf
+    """
+    flat = bgr.copy()
+    for name in names:
+        x, y, w, h = detector._resolve_roi(name)
+        top, left = max(0, y - RADIUS), max(0, x - RADIUS)
+        patch = flat[top:y + h + RADIUS, left:x + w + RADIUS]
+        patch[:] = 0
+        rows = rng.integers(0, patch.shape[0], 5)
+        cols = rng.integers(0, patch.shape[1], 5)
+        patch[rows, cols] = 255
+    return flat
+
+
+def test_single_pass_finds_what_concentric_search_finds(make_detector):
+    options = dict(track_last_hit=False, prefilter=False)
+    single_pass = make_detector(radius_search_mode="single_pass", **options)
+    concentric = make_detector(radius_search_mode="concentric", **options)
+    generator = SyntheticFrameGenerator(single_pass.detection_config, seed=2, outside_margin=RADIUS)
+    names = [
+        name for name, template in single_pass.templates.items()
+        if template.strategy != "color_threshold" and single_pass._resolve_roi(name)
+    ]
+
+    rng = np.random.default_rng(0)
+
+    for bgr, _ in generator.frames(6):
+        for name in names:
+            expected = concentric.find(Frame(bgr), name, RADIUS)
+            assert single_pass.find(Frame(bgr), name, RADIUS) == expected, name
+
+        for flat in (_flatten_patches(bgr, single_pass, names, rng), np.zeros_like(bgr)):
+            for name in names:
+                assert concentric.find(Frame(flat), name, RADIUS) is None, name
+                assert single_pass.find(Frame(flat), name, RADIUS) is None, name
@@ -0,0 +1,54 @@
+from src.bot.config import Config
+from src.bot.core.game.frame import Frame
+from src.bot.core.game.recorder import ReplayDetector, SessionRecorder
+from src.bot.tools.synthetic_frames import SyntheticFrameGenerator, evaluate
+
+# A ROI capture of the lower right corner: the fishing button and the rod icons
+CROP = (1380, 520, 540, 560)
+
+
+def _inside(roi, crop):
+    x, y, w, h = roi
+    cx, cy, cw, ch = crop
+    return cx <= x and cy <= y and x + w <= cx + cw and y + h <= cy + ch
+
+
+def test_recording_replays_frames_origins_and_detections(tmp_path, make_detector):
+    reference = make_detector(track_last_hit=False)
+    generator = SyntheticFrameGenerator(reference.detection_config, seed=3)
+    cx, cy, cw, ch = CROP
+
+    full, partial = [], []
+    recorder = SessionRecorder(tmp_path / "session", reference.detection_config.base_resolution, chunk_size=2)
+    for i, (bgr, truth) in enumerate(generator.frames(5)):
+        crop = bgr[cy:cy + ch, cx:cx + cw]
+        recorder.record(Frame(crop, timestamp=i / 30, origin=(cx, cy)))
+        full.append((bgr, (0, 0), truth))
+        partial.append((crop, (cx, cy), truth))
+    recorder.close()
+
+    config = Config()
+    config.bot.detection.template_cache = False
+    config.bot.detection.change_gate = False
+    config.bot.detection.track_last_hit = False
+    replay = ReplayDetector(config, tmp_path / "session", speed=0)
+    replayed = []
+    while (frame := replay.capture_screen()) is not None:
+        replayed.append(frame)
+
+    assert replay.frames_played == len(partial)
+    assert [frame.origin for frame in replayed] == [origin for _, origin, _ in partial]
+
+    names = [name for name in reference.templates if _inside(reference._resolve_roi(name) or (0, 0, 0, 0), CROP)]
+    assert names
+    for frame, (bgr, _, _) in zip(replayed, full):
+        for name in names:
+            assert replay.find(frame, name) == reference.find(Frame(bgr), name), name
+
+    # Partial frames score like the full frames they were cut from
+    samples = [(frame.bgr, frame.origin, truth) for frame, (_, _, truth) in zip(replayed, partial)]
+    expected = evaluate(reference, full)
+    report = evaluate(replay, samples)
+    for name in names:
+        assert report[f"{name}@r0"] == expected[f"{name}@r0"], name
+    assert sum(report[f"{name}@r0"]["tp"] for name in names) > 0
@@ -0,0 +1,48 @@
+import shutil
+
+import cv2 as cv
+import numpy as np
+
+from src.bot.config.paths import TEMPLATES_PATH
+from src.bot.core.game import template_bank
+
+
+def test_match_never_returns_nan_or_inf(make_detector):
+    detector = make_detector()
+    for name, template in detector.templates.items():
+        flat = np.zeros((template.height + 20, template.width + 20), dtype=np.uint8)
+        result = template.match(flat)
+        assert np.isfinite(result).all(), name
+        assert result.max() < template.threshold, name
+
+
+def _compile(path, cache_dir, scale=1.0, **settings):
+    return template_bank.compile_template("sample", path, scale=scale, settings=settings, cache_dir=cache_dir)
+
+
+def test_cache_keeps_one_entry_per_png_and_scale(tmp_path, monkeypatch):
+    monkeypatch.setattr(template_bank, "_compiled", {})
+    path = tmp_path / "sample.png"
+    shutil.copy(TEMPLATES_PATH / "reg_pole.png", path)
+    cache_dir = tmp_path / "cache"
+
+    _compile(path, cache_dir, threshold=0.8)
+    _compile(path, cache_dir, threshold=0.9)
+    assert len(list(cache_dir.glob("sample-*.npz"))) == 1
+
+    # Scales do not evict each other
+    half = _compile(path, cache_dir, scale=0.5, threshold=0.8)
+    assert len(list(cache_dir.glob("sample-*.npz"))) == 2
+
+    # The disk entry is reused, but the threshold still reaches the template
+    monkeypatch.setattr(template_bank, "_compiled", {})
+    strict = _compile(path, cache_dir, scale=0.5, threshold=0.95)
+    assert strict.threshold == 0.95
+    assert np.array_equal(strict.gray, half.gray)
+    assert len(list(cache_dir.glob("sample-*.npz"))) == 2
+
+    # A changed PNG replaces every entry of the old one
+    image = cv.imread(str(path), cv.IMREAD_UNCHANGED)
+    cv.imwrite(str(path), 255 - image)
+    _compile(path, cache_dir, threshold=0.8)
+    assert len(list(cache_dir.glob("sample-*.npz"))) == 1
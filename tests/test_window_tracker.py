@@ -0,0 +1,25 @@
+from src.bot.config import Config
+from src.bot.core.game.detector import Detector
+from src.bot.utils.window_tracker import WindowGeometry, WindowTracker
+
+
+def test_closing_the_detector_stops_following_the_window():
+    config = Config()
+    config.bot.detection.template_cache = False
+    screen = config.bot.screen
+    screen.tracker = WindowTracker("test window", poll_interval=60)
+    screen.tracker._geometry = WindowGeometry(0, 0, *config.bot.detection.base_resolution)
+
+    detector = Detector(config)
+    assert screen.tracker.is_running()
+    assert len(screen.tracker._subscribers) == 1
+
+    detector.close()
+    assert not screen.tracker.is_running()
+    assert screen.tracker._subscribers == []
+
+    # Closing twice is harmless, and a new detector follows the window again
+    detector.close()
+    Detector(config)
+    assert screen.tracker.is_running()
+    screen.tracker.stop()